@@ -16,6 +16,7 @@ import requests
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 from fastapi import APIRouter, File, HTTPException, Header, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from config import MANAGER_VERSION
@@ -348,7 +349,7 @@ async def install_experimental_addon(file: UploadFile = File(...)):
     except Exception as e:
         raise HTTPException(400, f"Failed to read file: {e}") from e
     try:
-        dest.write_bytes(contents)
+        await run_in_threadpool(dest.write_bytes, contents)
     except Exception as e:
         raise HTTPException(500, f"Failed to write addon: {e}") from e
     _invalidate_addon_info_snapshot()
@@ -26,6 +26,22 @@ def _worlds_dir():
     return os.path.join(resolve_instance(SERVER_DIR), "universe", "worlds")
 
 
+def _write_if_changed(path: str, content: str) -> bool:
+    """Write *content* to *path* unless the file already holds exactly that text.
+    Re-saving an unchanged editor skips the write (and the mtime bump the server
+    may react to). Returns True if the file was written."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+
 @router.get("/worlds")
 def list_worlds():
     """List world names (subdirs of Server/universe/worlds)."""
@@ -72,9 +88,7 @@ def save_world_config(world_name: str, body: SaveConfigRequest):
     except json.JSONDecodeError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid JSON: {exc}")
     try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        _write_if_changed(path, content)
         return {"ok": True}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
@@ -118,9 +132,7 @@ def save_config(filename: str, body: SaveConfigRequest):
         raise HTTPException(status_code=400, detail=f"Invalid JSON: {exc}")
 
     try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        _write_if_changed(path, content)
         return {"ok": True}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
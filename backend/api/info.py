@@ -9,9 +9,9 @@ import subprocess
 import sys
 import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import requests
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
@@ -22,6 +22,9 @@ from services import downloader as dl
 from services import github as gh
 
 router = APIRouter()
+# /info runs the Java probe (subprocess) and the addon update check (HTTP);
+# the probe goes to this pool so the two overlap instead of adding up.
+_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="info-probe")
 _ADDON_UPDATE_CACHE_TTL_S = 300
 _addon_update_cache: dict | None = None
 _addon_update_cached_at = 0.0
@@ -111,7 +114,7 @@ def _get_experimental_addon_update_snapshot() -> dict:
 
 @router.get("/info")
 def info():
-    java_ok, java_version = check_java()
+    java_future = _PROBE_EXECUTOR.submit(check_java)
     try:
         from plugin_loader import experimental_addon_loaded, experimental_addon_features
     except ImportError:
@@ -130,6 +133,7 @@ def info():
         addon_disk_version = get_installed_experimental_addon_version()
     except Exception:
         addon_disk_version = None
+    java_ok, java_version = java_future.result()
     return {
         "manager_version": MANAGER_VERSION,
         "java_ok": java_ok,
@@ -180,9 +184,9 @@ def public_ip():
 
 
 @router.get("/info/manager-update")
-def manager_update():
-    """Check GitHub for a newer manager release (synchronous)."""
-    return gh.check_manager_update_sync()
+def manager_update(refresh: bool = False):
+    """Check GitHub for a newer manager release (synchronous). ``refresh=1`` bypasses cached answers."""
+    return gh.check_manager_update_sync(force=refresh)
 
 
 @router.post("/info/fetch-downloader")
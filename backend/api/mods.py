@@ -8,6 +8,7 @@ import os
 import shutil
 
 from fastapi import APIRouter, File, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
@@ -129,6 +130,11 @@ def ensure_webserver_port():
     return {"ok": True}
 
 
+def _save_upload(file: UploadFile, dest: str) -> None:
+    with open(dest, "wb") as f:
+        shutil.copyfileobj(file.file, f)
+
+
 @router.post("/upload")
 async def upload_mods(files: list[UploadFile] = File(...)):
     """Upload .jar file(s) to the mods folder. Requires server stopped."""
@@ -156,8 +162,8 @@ async def upload_mods(files: list[UploadFile] = File(...)):
             continue
         dest = os.path.join(mods_dir, os.path.basename(name))
         try:
-            with open(dest, "wb") as f:
-                shutil.copyfileobj(file.file, f)
+            # Disk write runs in the threadpool so a large jar doesn't stall the event loop
+            await run_in_threadpool(_save_upload, file, dest)
             uploaded.append(name)
         except OSError as e:
             errors.append(f"{name}: {e}")
@@ -4,6 +4,8 @@ Server API routes – start / stop / status / live console SSE.
 
 import asyncio
 import json
+import threading
+from collections import deque
 from datetime import datetime, timezone
 from fastapi import APIRouter, Body
 from fastapi.responses import StreamingResponse, JSONResponse
@@ -13,17 +15,25 @@ from services import server as server_svc
 router = APIRouter()
 
 
+# Console lines kept for replay to late subscribers; older lines are dropped so
+# a server running for days doesn't grow the backend without bound.
+_CONSOLE_BUFFER_LINES = 10_000
+
+
 # ---------------------------------------------------------------------------
 # Per-instance console state – bridges thread callbacks to async SSE subscribers
 # ---------------------------------------------------------------------------
 
 class _ConsoleManager:
     def __init__(self):
-        self.buffer: list[str] = []
+        self.buffer: deque[str] = deque(maxlen=_CONSOLE_BUFFER_LINES)
         self.subscribers: list[asyncio.Queue] = []
         self.server_active = False
         self.last_exit_code: int | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
+        # Lines from the server thread waiting for the next drain on the event loop
+        self._pending: list[str] = []
+        self._pending_lock = threading.Lock()
 
     def reset(self, loop: asyncio.AbstractEventLoop):
         self.buffer.clear()
@@ -31,12 +41,14 @@ class _ConsoleManager:
         self.server_active = True
         self.last_exit_code = None
         self._loop = loop
+        with self._pending_lock:
+            self._pending.clear()
 
-    def push_line(self, line: str):
-        self.buffer.append(line)
+    def push_lines(self, lines: list[str]):
+        self.buffer.extend(lines)
         for q in list(self.subscribers):
             try:
-                q.put_nowait(("output", line))
+                q.put_nowait(("output", lines))
             except Exception:
                 pass
 
@@ -49,15 +61,33 @@ class _ConsoleManager:
             except Exception:
                 pass
 
+    def _drain(self):
+        with self._pending_lock:
+            lines, self._pending = self._pending, []
+        if lines:
+            self.push_lines(lines)
+
     def on_output(self, line: str):
-        if self._loop:
-            self._loop.call_soon_threadsafe(self.push_line, line)
+        # Batch lines: only the first line after a drain wakes the event loop,
+        # later ones ride along until the scheduled drain runs.
+        if not self._loop:
+            return
+        with self._pending_lock:
+            self._pending.append(line)
+            if len(self._pending) > 1:
+                return
+        self._loop.call_soon_threadsafe(self._drain)
 
     def on_done(self, rc: int):
         if self._loop:
             self._loop.call_soon_threadsafe(self.push_done, rc)
 
 
+def _output_events(lines: list[str]) -> str:
+    """One SSE chunk carrying an output event per line."""
+    return "".join(f"event: output\ndata: {json.dumps({'line': line})}\n\n" for line in lines)
+
+
 _consoles: dict[str, _ConsoleManager] = {}
 
 
@@ -172,10 +202,15 @@ async def start(body: dict = Body(default=None)):
 def stop(body: dict = Body(default=None)):
     body = body or {}
     if body.get("all"):
-        server_svc.stop_all()
+        stopped = server_svc.stop_all()
     else:
         instance_name = body.get("instance")
-        server_svc.stop(instance_name=instance_name)
+        stopped = server_svc.stop(instance_name=instance_name)
+    if not stopped:
+        return JSONResponse(
+            {"ok": False, "error": "Server process is still running after the forced stop"},
+            status_code=500,
+        )
     return {"ok": True}
 
 
@@ -206,8 +241,8 @@ async def console(instance: str | None = None):
 
     async def generate():
         try:
-            for line in list(console_mgr.buffer):
-                yield f"event: output\ndata: {json.dumps({'line': line})}\n\n"
+            if console_mgr.buffer:
+                yield _output_events(list(console_mgr.buffer))
             if not console_mgr.server_active and console_mgr.last_exit_code is not None:
                 yield f"event: done\ndata: {json.dumps({'code': console_mgr.last_exit_code})}\n\n"
                 return
@@ -215,7 +250,7 @@ async def console(instance: str | None = None):
                 try:
                     event_type, data = await asyncio.wait_for(queue.get(), timeout=30)
                     if event_type == "output":
-                        yield f"event: output\ndata: {json.dumps({'line': data})}\n\n"
+                        yield _output_events(data)
                     elif event_type == "done":
                         yield f"event: done\ndata: {json.dumps({'code': data})}\n\n"
                         break
@@ -2,6 +2,7 @@
 Settings API routes – read/write persistent app settings.
 """
 
+import functools
 import os
 import re
 import subprocess
@@ -15,6 +16,8 @@ from utils.secret_redaction import sanitize_settings_for_api
 
 router = APIRouter()
 
+_RULE_SPLIT_RE = re.compile(r"\n(?=Rule Name:)")
+
 
 def _get_firewall_rules_for_ports(port_protocols: list[tuple[int, str]]) -> dict[str, bool]:
     """Check which (port, protocol) pairs have an inbound Allow rule. Returns { "port:protocol": bool }. Windows only."""
@@ -40,7 +43,7 @@ def _get_firewall_rules_for_ports(port_protocols: list[tuple[int, str]]) -> dict
         return result
 
     # Parse rule blocks: each has Rule Name, LocalPort, Protocol, Direction, Action
-    blocks = re.split(r"\n(?=Rule Name:)", output)
+    blocks = _RULE_SPLIT_RE.split(output)
     port_proto_allowed: set[tuple[int, str]] = set()
     for block in blocks:
         if "Rule Name:" not in block:
@@ -68,8 +71,13 @@ def _get_firewall_rules_for_ports(port_protocols: list[tuple[int, str]]) -> dict
     return result
 
 
+@functools.lru_cache(maxsize=None)
+def _field_re(key: str) -> re.Pattern:
+    return re.compile(rf"^\s*{re.escape(key)}:\s*(.+)$", re.MULTILINE)
+
+
 def _extract(block: str, key: str) -> str:
-    m = re.search(rf"^\s*{re.escape(key)}:\s*(.+)$", block, re.MULTILINE)
+    m = _field_re(key).search(block)
     return m.group(1).strip() if m else ""
 
 
@@ -215,28 +223,30 @@ def get_settings():
 
 @router.put("/settings")
 def update_settings(body: UpdateSettingsRequest):
-    if body.root_dir is not None:
-        path = os.path.abspath(body.root_dir)
-        os.makedirs(path, exist_ok=True)
-        settings.set_root_dir(path)
-    if body.experimental_addon_license_key is not None:
-        settings.set_experimental_addon_license_key(body.experimental_addon_license_key)
-    if body.experimental_addon_feature_flags is not None:
-        settings.set_experimental_addon_feature_flags(body.experimental_addon_feature_flags)
-    if body.instance_name and body.instance_server_settings is not None:
-        settings.set_instance_server_settings(body.instance_name, body.instance_server_settings)
-    if body.instance_name:
-        game = body.game_port if body.game_port is not None and 1 <= body.game_port <= 65535 else None
-        webserver = body.webserver_port if body.webserver_port is not None and 1 <= body.webserver_port <= 65535 else None
-        if game is not None or webserver is not None:
-            cur_g, cur_w = settings.get_instance_port(body.instance_name)
-            game = game if game is not None else cur_g or 5520
-            webserver = webserver if webserver is not None else (cur_w if cur_w is not None else game + 100)
-            settings.set_instance_port(body.instance_name, game, webserver)
-            root = settings.get_root_dir()
-            if root and webserver is not None:
-                server_dir = os.path.join(root, body.instance_name, "Server")
-                if os.path.isdir(server_dir):
-                    from services.nitrado_plugins import set_webserver_port
-                    set_webserver_port(server_dir, webserver)
+    # One settings.json write for the whole request instead of one per setter.
+    with settings.batch():
+        if body.root_dir is not None:
+            path = os.path.abspath(body.root_dir)
+            os.makedirs(path, exist_ok=True)
+            settings.set_root_dir(path)
+        if body.experimental_addon_license_key is not None:
+            settings.set_experimental_addon_license_key(body.experimental_addon_license_key)
+        if body.experimental_addon_feature_flags is not None:
+            settings.set_experimental_addon_feature_flags(body.experimental_addon_feature_flags)
+        if body.instance_name and body.instance_server_settings is not None:
+            settings.set_instance_server_settings(body.instance_name, body.instance_server_settings)
+        if body.instance_name:
+            game = body.game_port if body.game_port is not None and 1 <= body.game_port <= 65535 else None
+            webserver = body.webserver_port if body.webserver_port is not None and 1 <= body.webserver_port <= 65535 else None
+            if game is not None or webserver is not None:
+                cur_g, cur_w = settings.get_instance_port(body.instance_name)
+                game = game if game is not None else cur_g or 5520
+                webserver = webserver if webserver is not None else (cur_w if cur_w is not None else game + 100)
+                settings.set_instance_port(body.instance_name, game, webserver)
+                root = settings.get_root_dir()
+                if root and webserver is not None:
+                    server_dir = os.path.join(root, body.instance_name, "Server")
+                    if os.path.isdir(server_dir):
+                        from services.nitrado_plugins import set_webserver_port
+                        set_webserver_port(server_dir, webserver)
     return sanitize_settings_for_api(settings.get_all())
@@ -47,13 +47,55 @@ def status():
 @router.post("/check")
 def check():
     """Check remote versions and return full update status (slow, network calls)."""
-    return updater.get_update_status()
+    return updater.get_update_status(force=True)
 
 
 @router.get("/check-all")
-def check_all():
-    """Check update availability for all installed instances. Runs on startup, cached until invalidated."""
-    return updater.get_all_instances_update_status()
+def check_all(refresh: bool = False):
+    """Check update availability for all installed instances. Runs on startup, cached until invalidated.
+    ``refresh=1`` skips the prefetched remote versions."""
+    return updater.get_all_instances_update_status(force=refresh)
+
+
+class _OperationEvents:
+    """
+    Bridges updater worker-thread callbacks onto an SSE queue.
+
+    The callbacks are bound methods handed straight to the worker, so no
+    per-stream closures are built. Progress is coalesced: only the latest
+    (percent, detail) is kept and the event loop is woken once per batch.
+    Updates identical to the last one sent are dropped.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        self._loop = loop
+        self._queue = queue
+        self._pending_progress: Optional[dict] = None
+        self._progress_scheduled = False
+        self._last_progress: Optional[dict] = None
+
+    def on_status(self, msg: str):
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, ("status", {"message": msg}))
+
+    def on_progress(self, percent: float, detail: str):
+        self._pending_progress = {"percent": percent, "detail": detail}
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self._loop.call_soon_threadsafe(self._flush_progress)
+
+    def on_done(self, ok: bool, msg: str, meta: Optional[dict] = None):
+        payload = {"ok": ok, "message": msg}
+        if meta:
+            payload.update(meta)
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, ("done", payload))
+
+    def _flush_progress(self):
+        # Clear the flag before reading so a concurrent update reschedules.
+        self._progress_scheduled = False
+        data, self._pending_progress = self._pending_progress, None
+        if data is not None and data != self._last_progress:
+            self._last_progress = data
+            self._queue.put_nowait(("progress", data))
 
 
 def _sse_stream_for_operation(
@@ -68,33 +110,17 @@ def _sse_stream_for_operation(
         from utils.log_buffer import append
         append(f"[SSE] setup/update stream started, patchline={patchline}")
         queue: asyncio.Queue = asyncio.Queue()
-        loop = asyncio.get_event_loop()
-
-        def on_status(msg: str):
-            loop.call_soon_threadsafe(
-                queue.put_nowait, ("status", {"message": msg})
-            )
-
-        def on_progress(percent: float, detail: str):
-            loop.call_soon_threadsafe(
-                queue.put_nowait, ("progress", {"percent": percent, "detail": detail})
-            )
-
-        def on_done(ok: bool, msg: str, meta: Optional[dict] = None):
-            payload = {"ok": ok, "message": msg}
-            if meta:
-                payload.update(meta)
-            loop.call_soon_threadsafe(queue.put_nowait, ("done", payload))
+        events = _OperationEvents(asyncio.get_event_loop(), queue)
 
         # Send immediate status so the client knows the connection works
-        on_status("Starting backend...")
+        events.on_status("Starting backend...")
         append("[SSE] first event (Starting backend...) queued")
 
         operation_fn(
             patchline,
-            on_status=on_status,
-            on_progress=on_progress,
-            on_done=on_done,
+            on_status=events.on_status,
+            on_progress=events.on_progress,
+            on_done=events.on_done,
             graceful=graceful,
             skip_backup=skip_backup,
         )
@@ -138,24 +164,12 @@ def _sse_stream_for_update_all(graceful: bool = False):
     """Create an SSE StreamingResponse for update-all operation."""
     async def generate():
         queue = asyncio.Queue()
-        loop = asyncio.get_event_loop()
-
-        def on_status(msg: str):
-            loop.call_soon_threadsafe(queue.put_nowait, ("status", {"message": msg}))
-
-        def on_progress(percent: float, detail: str):
-            loop.call_soon_threadsafe(queue.put_nowait, ("progress", {"percent": percent, "detail": detail}))
-
-        def on_done(ok: bool, msg: str, meta: Optional[dict] = None):
-            payload = {"ok": ok, "message": msg}
-            if meta:
-                payload.update(meta)
-            loop.call_soon_threadsafe(queue.put_nowait, ("done", payload))
+        events = _OperationEvents(asyncio.get_event_loop(), queue)
 
         updater.perform_update_all(
-            on_status=on_status,
-            on_progress=on_progress,
-            on_done=on_done,
+            on_status=events.on_status,
+            on_progress=events.on_progress,
+            on_done=events.on_done,
             graceful=graceful,
             graceful_minutes=1,
         )
@@ -34,3 +34,5 @@ PATCHLINE_FILE = "server_patchline.txt"
 BACKUP_DIR = "backups"
 SERVER_DIR = "Server"
 SERVER_JAR = os.path.join(SERVER_DIR, "HytaleServer.jar")
+# Files shipped next to Server/ in an instance folder.
+SERVER_ROOT_FILES = ("Assets.zip", "start.bat", "start.sh")
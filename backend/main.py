@@ -84,6 +84,9 @@ def create_app():
 
     @contextlib.asynccontextmanager
     async def lifespan(app):
+        from utils.java import warm_java_cache
+
+        warm_java_cache()
         try:
             from plugin_loader import run_experimental_startup_hooks
 
@@ -4,6 +4,7 @@ Authentication / credential management.
 
 import os
 import threading
+import time
 from typing import Callable, Optional
 
 from services import downloader as dl
@@ -12,15 +13,48 @@ from utils.paths import resolve_root
 from config import CREDENTIALS_FILE
 
 
+# A health check runs the downloader (a second or more). The answer is kept
+# while the credentials file is unchanged (mtime, size); a login or token
+# refresh rewrites the file and drops it. The TTL bounds how long a token
+# that expired server-side can still be reported as valid.
+_HEALTH_TTL_S = 5 * 60
+_health_cache: tuple[tuple[int, int], float, dict] | None = None
+
+
 def has_credentials() -> bool:
     return dl.has_credentials()
 
 
+def _credentials_signature() -> tuple[int, int] | None:
+    try:
+        st = os.stat(dl.credentials_path())
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def invalidate_auth_health() -> None:
+    global _health_cache
+    _health_cache = None
+
+
 def get_auth_health() -> dict:
     """
     Check whether stored auth is still valid for downloader API calls.
     """
-    has_creds = dl.has_credentials()
+    global _health_cache
+    sig = _credentials_signature()
+    cached = _health_cache
+    if sig is not None and cached is not None and cached[0] == sig and 0 <= time.time() - cached[1] < _HEALTH_TTL_S:
+        return cached[2]
+    result = _check_auth_health(sig is not None)
+    # Only definitive answers are kept; timeouts and upstream errors are retried.
+    if sig is not None and result["error_kind"] in (None, "auth_expired", "auth_missing"):
+        _health_cache = (sig, time.time(), result)
+    return result
+
+
+def _check_auth_health(has_creds: bool) -> dict:
     if not has_creds:
         return {
             "has_credentials": False,
@@ -40,7 +74,7 @@ def get_auth_health() -> dict:
         }
 
     rc, out = dl.print_version("release")
-    if rc == 0 and out and not out.startswith("[ERROR]"):
+    if rc == 0 and out and not dl.is_error_output(out):
         return {
             "has_credentials": True,
             "auth_valid": True,
@@ -108,6 +142,7 @@ def refresh_auth(
         creds = resolve_root(CREDENTIALS_FILE)
         if os.path.isfile(creds):
             os.remove(creds)
+        invalidate_auth_health()
 
         if on_output:
             on_output("Credentials deleted. Opening browser for login...")
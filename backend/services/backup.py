@@ -2,18 +2,21 @@
 Backup creation, restoration, listing, and deletion.
 """
 
+import functools
 import json
 import os
 import re
 import shutil
 import tempfile
+import threading
 import zipfile
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 from config import (
     BACKUP_DIR,
     SERVER_DIR,
+    SERVER_ROOT_FILES,
     VERSION_FILE,
     PATCHLINE_FILE,
 )
@@ -21,6 +24,21 @@ from utils.paths import resolve_instance, resolve_instance_by_name, ensure_dir
 
 _META_FILE = "backup_info.json"
 
+# Instance-root files copied alongside Server/ when backing up or restoring.
+_INSTANCE_FILES = (*SERVER_ROOT_FILES, VERSION_FILE, PATCHLINE_FILE)
+
+# Compiled once and shared by every BackupEntry (list_backups builds one per folder).
+_UPDATE_LABEL_RE = re.compile(
+    r'update from\s+(\S+)\s+\(([^)]+)\)\s+to\s+(\S+)\s+\(([^)]+)\)',
+    re.IGNORECASE,
+)
+_SHORT_VERSION_RE = re.compile(r'(\d{4}\.\d{2}\.\d{2})')
+
+# folder path -> (signature, entry); list_backups reuses entries whose folder is unchanged
+_entry_cache: dict[str, tuple[tuple, "BackupEntry"]] = {}
+# Backup routes run concurrently on the threadpool; guards every access to _entry_cache.
+_entry_cache_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Data class for backup entries
@@ -75,10 +93,7 @@ class BackupEntry:
         """Try to extract info from old-style folder names for backward compat."""
         name = self.folder_name
 
-        m = re.match(
-            r'update from\s+(\S+)\s+\(([^)]+)\)\s+to\s+(\S+)\s+\(([^)]+)\)',
-            name, re.IGNORECASE,
-        )
+        m = _UPDATE_LABEL_RE.match(name)
         if m:
             self.backup_type = "pre-update"
             self.label = "Pre-update backup"
@@ -135,7 +150,7 @@ class BackupEntry:
 def _short_version(v: str) -> str:
     if not v:
         return v
-    m = re.match(r'(\d{4}\.\d{2}\.\d{2})', v)
+    m = _SHORT_VERSION_RE.match(v)
     return m.group(1) if m else v
 
 
@@ -198,15 +213,48 @@ def _copy_server_for_backup(
 # Public API
 # ---------------------------------------------------------------------------
 
+def _entry_signature(path: str) -> tuple | None:
+    """Cheap change marker for a backup folder: folder ctime/mtime plus metadata mtime."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    try:
+        meta_mtime = os.stat(os.path.join(path, _META_FILE)).st_mtime_ns
+    except OSError:
+        meta_mtime = None
+    return (st.st_ctime_ns, st.st_mtime_ns, meta_mtime)
+
+
+def _get_entry(path: str) -> BackupEntry:
+    """Return a BackupEntry for *path*, reusing the cached one if the folder is unchanged."""
+    sig = _entry_signature(path)
+    with _entry_cache_lock:
+        cached = _entry_cache.get(path)
+    if cached is not None and sig is not None and cached[0] == sig:
+        return cached[1]
+    entry = BackupEntry(path)
+    if sig is not None:
+        with _entry_cache_lock:
+            _entry_cache[path] = (sig, entry)
+    return entry
+
+
 def list_backups() -> list[BackupEntry]:
     backup_root = resolve_instance(BACKUP_DIR)
     if not os.path.isdir(backup_root):
         return []
     entries = []
+    seen: set[str] = set()
     for name in os.listdir(backup_root):
         full = os.path.join(backup_root, name)
         if os.path.isdir(full):
-            entries.append(BackupEntry(full))
+            seen.add(full)
+            entries.append(_get_entry(full))
+    # Drop cached entries for folders removed since the last listing
+    with _entry_cache_lock:
+        for path in [p for p in _entry_cache if os.path.dirname(p) == backup_root and p not in seen]:
+            del _entry_cache[path]
     entries.sort(key=lambda e: e.created, reverse=True)
     return entries
 
@@ -219,14 +267,13 @@ def find_backup(folder_name: str) -> BackupEntry | None:
     return None
 
 
-def create_backup_for_instance(
-    instance_name: str,
-    label: Optional[str] = None,
-    *,
-    exclude_server_cache: bool = False,
+def _create_backup(
+    resolve: Callable[..., str],
+    label: Optional[str],
+    exclude_server_cache: bool,
 ) -> BackupEntry:
-    """Create a backup for a specific instance (used by update-all)."""
-    backup_root = ensure_dir(resolve_instance_by_name(instance_name, BACKUP_DIR))
+    """Shared body of the backup entry points; *resolve* maps names into the instance."""
+    backup_root = ensure_dir(resolve(BACKUP_DIR))
     now = datetime.now()
     folder_name = now.strftime("backup_%Y-%m-%d_%I%M%p")
 
@@ -236,7 +283,7 @@ def create_backup_for_instance(
         dest = os.path.join(backup_root, f"{folder_name}_{counter}")
         counter += 1
 
-    server_dir = resolve_instance_by_name(instance_name, SERVER_DIR)
+    server_dir = resolve(SERVER_DIR)
     if not os.path.isdir(server_dir):
         raise FileNotFoundError("No Server folder to backup.")
 
@@ -247,16 +294,13 @@ def create_backup_for_instance(
         exclude_server_cache=exclude_server_cache,
     )
 
-    for name in ("Assets.zip", "start.bat", "start.sh", VERSION_FILE, PATCHLINE_FILE):
-        src = resolve_instance_by_name(instance_name, name)
+    for name in _INSTANCE_FILES:
+        src = resolve(name)
         if os.path.isfile(src):
             shutil.copy2(src, dest)
 
     if label and "update from" in label.lower():
-        m = re.match(
-            r'update from\s+(\S+)\s+\(([^)]+)\)\s+to\s+(\S+)\s+\(([^)]+)\)',
-            label, re.IGNORECASE,
-        )
+        m = _UPDATE_LABEL_RE.match(label)
         if m:
             _save_meta(
                 dest,
@@ -275,54 +319,22 @@ def create_backup_for_instance(
     return BackupEntry(dest)
 
 
-def create_backup(label: Optional[str] = None, *, exclude_server_cache: bool = False) -> BackupEntry:
-    backup_root = ensure_dir(resolve_instance(BACKUP_DIR))
-    now = datetime.now()
-    folder_name = now.strftime("backup_%Y-%m-%d_%I%M%p")
-
-    dest = os.path.join(backup_root, folder_name)
-    counter = 1
-    while os.path.exists(dest):
-        dest = os.path.join(backup_root, f"{folder_name}_{counter}")
-        counter += 1
-
-    server_dir = resolve_instance(SERVER_DIR)
-    if not os.path.isdir(server_dir):
-        raise FileNotFoundError("No Server folder to backup.")
-
-    os.makedirs(dest, exist_ok=True)
-    _copy_server_for_backup(
-        server_dir,
-        os.path.join(dest, "Server"),
-        exclude_server_cache=exclude_server_cache,
+def create_backup_for_instance(
+    instance_name: str,
+    label: Optional[str] = None,
+    *,
+    exclude_server_cache: bool = False,
+) -> BackupEntry:
+    """Create a backup for a specific instance (used by update-all)."""
+    return _create_backup(
+        functools.partial(resolve_instance_by_name, instance_name),
+        label,
+        exclude_server_cache,
     )
 
-    for name in ("Assets.zip", "start.bat", "start.sh", VERSION_FILE, PATCHLINE_FILE):
-        src = resolve_instance(name)
-        if os.path.isfile(src):
-            shutil.copy2(src, dest)
 
-    if label and "update from" in label.lower():
-        m = re.match(
-            r'update from\s+(\S+)\s+\(([^)]+)\)\s+to\s+(\S+)\s+\(([^)]+)\)',
-            label, re.IGNORECASE,
-        )
-        if m:
-            _save_meta(
-                dest,
-                backup_type="pre-update",
-                label="Pre-update backup",
-                from_version=m.group(1),
-                from_patchline=m.group(2),
-                to_version=m.group(3),
-                to_patchline=m.group(4),
-            )
-        else:
-            _save_meta(dest, backup_type="pre-update", label=label)
-    else:
-        _save_meta(dest, backup_type="manual", label=label or "Manual backup")
-
-    return BackupEntry(dest)
+def create_backup(label: Optional[str] = None, *, exclude_server_cache: bool = False) -> BackupEntry:
+    return _create_backup(resolve_instance, label, exclude_server_cache)
 
 
 def restore_backup(entry: BackupEntry) -> None:
@@ -335,7 +347,7 @@ def restore_backup(entry: BackupEntry) -> None:
         shutil.rmtree(server_dir)
     shutil.copytree(os.path.join(entry.path, "Server"), server_dir)
 
-    for name in ("Assets.zip", "start.bat", "start.sh", VERSION_FILE, PATCHLINE_FILE):
+    for name in _INSTANCE_FILES:
         src = os.path.join(entry.path, name)
         if os.path.isfile(src):
             shutil.copy2(src, resolve_instance(name))
@@ -358,11 +370,16 @@ def rename_backup(entry: BackupEntry, new_label: str) -> None:
         data["created"] = entry.created.isoformat()
     with open(meta_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+    # Don't rely on the mtime changing: coarse (FAT/exFAT) timestamps can miss a quick rename.
+    with _entry_cache_lock:
+        _entry_cache.pop(entry.path, None)
 
 
 def delete_backup(entry: BackupEntry) -> None:
     if os.path.isdir(entry.path):
         shutil.rmtree(entry.path)
+    with _entry_cache_lock:
+        _entry_cache.pop(entry.path, None)
 
 
 # ---------------------------------------------------------------------------
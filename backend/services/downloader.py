@@ -9,6 +9,7 @@ Credentials stay in root_dir (user's servers folder) as the downloader uses cwd.
 
 import os
 import io
+import shutil
 import sys
 import zipfile
 import threading
@@ -26,6 +27,45 @@ from utils.paths import resolve_root
 from utils.process import run_capture, run_in_thread
 
 
+# Every downloader run (server download, auth, version lookup) uses the
+# credentials file in the servers folder; background version lookups use
+# only_if_idle so they never start next to another run.
+_active_runs = 0
+_active_lock = threading.Lock()
+
+
+def is_busy() -> bool:
+    """True while any downloader process started by us is running."""
+    with _active_lock:
+        return _active_runs > 0
+
+
+def _begin_run(only_if_idle: bool = False) -> bool:
+    global _active_runs
+    with _active_lock:
+        if only_if_idle and _active_runs:
+            return False
+        _active_runs += 1
+        return True
+
+
+def _end_run() -> None:
+    global _active_runs
+    with _active_lock:
+        _active_runs -= 1
+
+
+def _track_run(on_done: Optional[Callable[[int], None]]) -> Callable[[int], None]:
+    _begin_run()
+
+    def _done(rc: int):
+        _end_run()
+        if on_done:
+            on_done(rc)
+
+    return _done
+
+
 def get_downloader_exe() -> str:
     """Return the downloader binary name for the current platform."""
     if sys.platform == "linux":
@@ -157,7 +197,7 @@ def fetch_downloader(
                 os.makedirs(dest_dir, exist_ok=True)
                 dest_path = os.path.join(dest_dir, target_name)
                 with zf.open(exe_name) as src, open(dest_path, "wb") as dst:
-                    dst.write(src.read())
+                    shutil.copyfileobj(src, dst, 1 << 20)
 
                 if sys.platform == "linux":
                     os.chmod(dest_path, 0o755)
@@ -173,10 +213,22 @@ def fetch_downloader(
     return t
 
 
-def print_version(patchline: str = "release") -> tuple[int, str]:
+def print_version(patchline: str = "release", *, only_if_idle: bool = False) -> tuple[int, str] | None:
+    """Run ``-print-version``. With *only_if_idle*, returns None instead of
+    starting while another downloader run is active."""
     from services.settings import get_root_dir
-    cmd = [downloader_path(), "-print-version", "-patchline", patchline, "-skip-update-check"]
-    return run_capture(cmd, cwd=get_root_dir(), timeout=30)
+    if not _begin_run(only_if_idle):
+        return None
+    try:
+        cmd = [downloader_path(), "-print-version", "-patchline", patchline, "-skip-update-check"]
+        return run_capture(cmd, cwd=get_root_dir(), timeout=30)
+    finally:
+        _end_run()
+
+
+def is_error_output(out: str) -> bool:
+    """True if downloader output is one of our own "[ERROR] ..." messages."""
+    return out.startswith("[ERROR]")
 
 
 def classify_version_error(output: str) -> tuple[str, str]:
@@ -229,7 +281,7 @@ def download_server(
     path = downloader_path()
     print(f"[downloader] Running: {path} (cwd={get_root_dir()})", file=sys.stderr, flush=True)
     cmd = [path, "-download-path", dest_zip, "-patchline", patchline, "-skip-update-check"]
-    return run_in_thread(cmd, cwd=get_root_dir(), on_output=on_output, on_done=on_done)
+    return run_in_thread(cmd, cwd=get_root_dir(), on_output=on_output, on_done=_track_run(on_done))
 
 
 def run_auth(
@@ -250,4 +302,4 @@ def run_auth(
     root = os.path.abspath(root)
     os.makedirs(root, exist_ok=True)
     cmd = [downloader_path(), "-print-version", "-skip-update-check"]
-    return run_in_thread(cmd, cwd=root, on_output=on_output, on_done=on_done)
+    return run_in_thread(cmd, cwd=root, on_output=on_output, on_done=_track_run(on_done))
@@ -2,64 +2,58 @@
 Check for manager self-updates via the GitHub Releases API.
 """
 
-import sys
 import threading
-from typing import Callable, Optional
+from typing import Optional
 
 from packaging.version import Version
 
 from config import MANAGER_VERSION, GITHUB_REPO
-from utils.http_retry import get_json_with_retry
+from services import github_cache
 
+# Single-flight guard for check_manager_update_sync: callers arriving while a
+# request is running wait for it and take its result instead of issuing another.
+_check_lock = threading.Lock()
+_check_generation = 0
+_last_check_result: Optional[dict] = None
 
-def check_manager_update(
-    on_done: Optional[Callable[[bool, str], None]] = None,
-) -> threading.Thread:
-    def _worker():
-        try:
-            url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-            data = get_json_with_retry(
-                url,
-                headers={"Accept": "application/vnd.github+json", "User-Agent": "Hytale-Server-Manager"},
-            )
-            tag = data.get("tag_name", "").lstrip("v")
-            if tag and Version(tag) > Version(MANAGER_VERSION):
-                if on_done:
-                    on_done(True, tag)
-            else:
-                if on_done:
-                    on_done(False, MANAGER_VERSION)
-        except Exception as e:
-            if on_done:
-                on_done(False, MANAGER_VERSION)
-            print(f"[github] Manager update check failed: {e}", file=sys.stderr, flush=True)
 
-    t = threading.Thread(target=_worker, daemon=True)
-    t.start()
-    return t
+def check_manager_update_sync(force: bool = False) -> dict:
+    """
+    Synchronous version for the API layer.
+    Responses come through github_cache (fresh for a few minutes, then
+    revalidated with a conditional request). Concurrent callers share one
+    in-flight request; *force* (the user's Refresh) always asks GitHub again.
+    """
+    global _check_generation, _last_check_result
+    generation = _check_generation
+    with _check_lock:
+        # Another caller finished a check while we waited: reuse its answer.
+        if not force and _check_generation != generation and _last_check_result is not None:
+            return _last_check_result
+        result = _fetch_manager_update(force)
+        _last_check_result = result
+        _check_generation += 1
+    return result
 
 
-def check_manager_update_sync() -> dict:
-    """Synchronous version for the API layer."""
+def _fetch_manager_update(force: bool = False) -> dict:
     try:
         url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-        data = get_json_with_retry(
-            url,
-            headers={"Accept": "application/vnd.github+json", "User-Agent": "Hytale-Server-Manager"},
-        )
+        data = github_cache.get_json(url, retries=3, max_age=0 if force else None)
         tag = data.get("tag_name", "").lstrip("v")
         download_url = data.get("html_url", "")
         if tag and Version(tag) > Version(MANAGER_VERSION):
-            return {
+            result = {
                 "update_available": True,
                 "latest_version": tag,
                 "download_url": download_url,
             }
-        return {
-            "update_available": False,
-            "latest_version": MANAGER_VERSION,
-            "download_url": "",
-        }
+        else:
+            result = {
+                "update_available": False,
+                "latest_version": MANAGER_VERSION,
+                "download_url": "",
+            }
     except Exception as e:
         return {
             "update_available": False,
@@ -68,3 +62,5 @@ def check_manager_update_sync() -> dict:
             "check_failed": True,
             "error": str(e),
         }
+
+    return result
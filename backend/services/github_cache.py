@@ -0,0 +1,121 @@
+"""
+Conditional-request cache for GitHub API GETs.
+
+Responses are stored in %APPDATA%/HytaleServerManager/cache/github.json with
+their ETag / Last-Modified validators. A body younger than _FRESH_TTL_S is
+returned without touching the network; older entries are revalidated, and a
+304 reply reuses the stored body (304s don't count against the rate limit).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.http_retry import with_retry
+
+_FRESH_TTL_S = 5 * 60
+_CACHE_FILE = os.path.join(
+    os.environ.get("APPDATA", os.path.expanduser("~")),
+    "HytaleServerManager",
+    "cache",
+    "github.json",
+)
+
+# One keep-alive pool for every GitHub API call, so a revalidation after the
+# first request skips the TCP/TLS handshake.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+_session.headers.update({"Accept": "application/vnd.github+json", "User-Agent": "Hytale-Server-Manager"})
+
+_lock = threading.Lock()
+_entries: dict[str, dict] | None = None
+
+
+def _load_entries() -> dict[str, dict]:
+    global _entries
+    if _entries is None:
+        try:
+            with open(_CACHE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _entries = data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            _entries = {}
+    return _entries
+
+
+def _save_entries() -> None:
+    try:
+        os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+        tmp = _CACHE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_entries, f)
+        os.replace(tmp, _CACHE_FILE)
+    except OSError as e:
+        print(f"[github_cache] Could not write cache: {e}", file=sys.stderr, flush=True)
+
+
+def _request(url: str, entry: dict | None, headers: dict[str, str] | None, timeout: float) -> dict:
+    req_headers = dict(headers or {})
+    if entry:
+        if entry.get("etag"):
+            req_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            req_headers["If-Modified-Since"] = entry["last_modified"]
+    resp = _session.get(url, timeout=timeout, headers=req_headers)
+    if resp.status_code == 304 and entry:
+        body = entry["body"]
+    else:
+        resp.raise_for_status()
+        body = resp.json()
+    return {
+        "etag": resp.headers.get("ETag") or (entry or {}).get("etag"),
+        "last_modified": resp.headers.get("Last-Modified") or (entry or {}).get("last_modified"),
+        "body": body,
+        "fetched_at": time.time(),
+    }
+
+
+def get_json(
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    timeout: float = 8,
+    retries: int = 1,
+    backoff_s: float = 0.5,
+    max_age: float | None = None,
+    stale_ok: bool = False,
+) -> Any:
+    """
+    GET *url* as JSON through the cache. *headers* are added to the session's
+    GitHub defaults. A stored body younger than *max_age* (default
+    _FRESH_TTL_S) is returned as is; pass ``max_age=0`` to always revalidate.
+    If every attempt fails, the last error is raised, or with *stale_ok* the
+    stored body is returned if there is one.
+    """
+    with _lock:
+        entry = _load_entries().get(url)
+    if max_age is None:
+        max_age = _FRESH_TTL_S
+    if entry and 0 <= time.time() - entry.get("fetched_at", 0) < max_age:
+        return entry["body"]
+
+    try:
+        fresh = with_retry(lambda: _request(url, entry, headers, timeout), retries=retries, backoff_s=backoff_s)
+    except Exception as e:
+        if stale_ok and entry:
+            print(f"[github_cache] Using cached response for {url}: {e}", file=sys.stderr, flush=True)
+            return entry["body"]
+        raise
+
+    with _lock:
+        _load_entries()[url] = fresh
+        _save_entries()
+    return fresh["body"]
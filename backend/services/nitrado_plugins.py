@@ -12,6 +12,8 @@ from typing import Callable, Optional
 
 import requests
 
+from services import github_cache
+
 # Nitrado WebServer = game_port + 100. When game port unknown, use 5620-5720.
 WEBSERVER_PORT_BASE = 5620  # 5520 + 100
 WEBSERVER_PORT_MAX = 5720
@@ -23,16 +25,11 @@ PLUGINS = [
 GITHUB_API = "https://api.github.com/repos/{repo}/releases/latest"
 
 
-_HEADERS = {"Accept": "application/vnd.github+json", "User-Agent": "Hytale-Server-Manager"}
-
-
 def _get_jar_url(repo: str) -> tuple[str, str] | None:
     """(browser_download_url, filename) for the .jar asset, or None."""
     url = GITHUB_API.format(repo=repo)
     try:
-        resp = requests.get(url, timeout=15, headers=_HEADERS)
-        resp.raise_for_status()
-        data = resp.json()
+        data = github_cache.get_json(url, timeout=15, stale_ok=True)
         for a in data.get("assets", []):
             name = (a.get("name") or "")
             if name.endswith(".jar"):
@@ -46,9 +43,7 @@ def _get_latest_version(repo: str, prefix: str) -> str | None:
     """Get latest version string from GitHub releases, or None."""
     url = GITHUB_API.format(repo=repo)
     try:
-        resp = requests.get(url, timeout=15, headers=_HEADERS)
-        resp.raise_for_status()
-        data = resp.json()
+        data = github_cache.get_json(url, timeout=15, stale_ok=True)
         tag = (data.get("tag_name") or "").lstrip("v")
         if tag:
             return tag
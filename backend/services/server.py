@@ -18,7 +18,7 @@ import time
 from dataclasses import dataclass, field
 from typing import Callable, Optional
 
-from config import SERVER_DIR, SERVER_JAR
+from config import SERVER_DIR, SERVER_JAR, SERVER_ROOT_FILES
 from services.settings import get_active_instance, get_instance_server_settings_for
 from utils.paths import resolve_instance, resolve_instance_by_name
 
@@ -296,7 +296,7 @@ def _apply_staged_update(instance_name: str, on_output: Optional[Callable[[str],
 
     staging_root = resolve_instance_by_name(instance_name, "updater", "staging")
     inst_dir = resolve_instance_by_name(instance_name, "")
-    for fname in ("Assets.zip", "start.bat", "start.sh"):
+    for fname in SERVER_ROOT_FILES:
         src = os.path.join(staging_root, fname)
         if os.path.isfile(src):
             shutil.copy2(src, os.path.join(inst_dir, fname))
@@ -441,19 +441,25 @@ def send_command(text: str, instance_name: Optional[str] = None) -> bool:
         return False
 
 
-def stop_all() -> None:
-    """Stop all running server instances."""
+def stop_all() -> bool:
+    """Stop all running server instances. Returns False if any is still alive."""
+    stopped = True
     for name in list(get_running_instances()):
-        stop(instance_name=name)
+        stopped = stop(instance_name=name) and stopped
+    return stopped
 
 
-def stop(instance_name: Optional[str] = None) -> None:
-    """Stop server. If instance_name None, stop active instance's server."""
+def stop(instance_name: Optional[str] = None) -> bool:
+    """
+    Stop server. If instance_name None, stop active instance's server.
+    Blocks until the process has exited; returns False only if it is still alive
+    after the forced kill, so callers don't need to poll ``is_instance_running``.
+    """
     inst = instance_name or get_active_instance()
     with _server_lock:
         entry = _server_processes.get(inst) if inst else None
         if not entry or entry.process.poll() is not None:
-            return
+            return True
         proc = entry.process
 
     send_command("stop\n", inst)
@@ -461,7 +467,7 @@ def stop(instance_name: Optional[str] = None) -> None:
         proc.wait(timeout=10)
         with _server_lock:
             _server_processes.pop(inst, None)
-        return
+        return True
     except subprocess.TimeoutExpired:
         pass
 
@@ -484,5 +490,10 @@ def stop(instance_name: Optional[str] = None) -> None:
             proc.kill()
         except OSError:
             pass
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        return False
     with _server_lock:
         _server_processes.pop(inst, None)
+    return True
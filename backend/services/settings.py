@@ -5,8 +5,10 @@ This module intentionally has ZERO project imports to avoid circular dependencie
 (paths.py imports from here).
 """
 
+import contextlib
 import json
 import os
+import threading
 from typing import Optional
 
 _SETTINGS_DIR = os.path.join(
@@ -19,6 +21,10 @@ _SETTINGS_SCHEMA_VERSION = 1
 
 _cache: dict | None = None
 _migrated: bool = False
+# Per-thread batch() state (nesting depth, whether a write was deferred).
+# Routes run on FastAPI's threadpool, so a batch only defers the setters
+# called on its own thread; other threads keep writing straight through.
+_batch_state = threading.local()
 
 
 def _migrate_settings(data: dict) -> tuple[dict, bool]:
@@ -67,10 +73,40 @@ def _load() -> dict:
 
 def _save(data: dict) -> None:
     global _cache
+    _cache = data
+    if getattr(_batch_state, "depth", 0):
+        _batch_state.dirty = True
+        return
+    _write(data)
+
+
+def _write(data: dict) -> None:
     os.makedirs(_SETTINGS_DIR, exist_ok=True)
     with open(_SETTINGS_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
-    _cache = data
+
+
+@contextlib.contextmanager
+def batch():
+    """Group several setter calls into a single settings.json write."""
+    state = _batch_state
+    state.depth = getattr(state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        state.depth -= 1
+        if not state.depth and getattr(state, "dirty", False):
+            state.dirty = False
+            _write(_cache)
+
+
+def _set(key: str, value) -> None:
+    """Store one setting, skipping the file write when the value is unchanged."""
+    s = load()
+    if key in s and s[key] == value:
+        return
+    s[key] = value
+    _save(s)
 
 
 def load() -> dict:
@@ -106,7 +142,10 @@ def get_root_dir() -> str:
 
 def set_root_dir(path: str) -> None:
     s = load()
-    s["root_dir"] = os.path.abspath(path)
+    path = os.path.abspath(path)
+    if s.get("root_dir") == path and s.get("onboarding_completed"):
+        return
+    s["root_dir"] = path
     s["onboarding_completed"] = True
     _save(s)
 
@@ -132,10 +171,8 @@ def add_ignored_instance(name: str) -> None:
 
 def remove_ignored_instance(name: str) -> None:
     """Show an instance in the manager again."""
-    s = load()
-    ignored = [x for x in s.get("ignored_instances", []) if x != name]
-    s["ignored_instances"] = ignored
-    _save(s)
+    ignored = [x for x in load().get("ignored_instances", []) if x != name]
+    _set("ignored_instances", ignored)
 
 
 # -- Instance order -----------------------------------------------------------
@@ -147,9 +184,7 @@ def get_instance_order() -> list[str]:
 
 def set_instance_order(names: list[str]) -> None:
     """Set the display order of instances."""
-    s = load()
-    s["instance_order"] = names
-    _save(s)
+    _set("instance_order", names)
 
 
 # -- Active instance ----------------------------------------------------------
@@ -160,9 +195,7 @@ def get_active_instance() -> str:
 
 
 def set_active_instance(name: str) -> None:
-    s = load()
-    s["active_instance"] = name
-    _save(s)
+    _set("active_instance", name)
 
 
 def get_active_instance_dir() -> str:
@@ -195,11 +228,9 @@ def get_instance_port(instance_name: str) -> tuple[int | None, int | None]:
 
 def set_instance_port(instance_name: str, game_port: int, webserver_port: int) -> None:
     """Store ports for an instance."""
-    s = load()
-    ports = dict(s.get("instance_ports", {}))
+    ports = dict(load().get("instance_ports", {}))
     ports[instance_name] = {"game": game_port, "webserver": webserver_port}
-    s["instance_ports"] = ports
-    _save(s)
+    _set("instance_ports", ports)
 
 
 # -- Experimental addon / Patreon license ------------------------------------
@@ -230,9 +261,7 @@ def get_experimental_addon_feature_flags() -> dict:
 
 def set_experimental_addon_feature_flags(flags: dict) -> None:
     """Store per-feature flags. Only stored keys are overrides; omit key = default on."""
-    s = load()
-    s["experimental_addon_feature_flags"] = {k: bool(v) for k, v in (flags or {}).items()}
-    _save(s)
+    _set("experimental_addon_feature_flags", {k: bool(v) for k, v in (flags or {}).items()})
 
 
 # -- Instance server settings (RAM limits, startup args) ---------------------------------
@@ -273,8 +302,7 @@ def set_instance_server_settings(instance_name: str, data: dict) -> None:
         current["startup_args"] = [str(a).strip() for a in (args or []) if str(a).strip()]
 
     all_settings[instance_name] = current
-    s["instance_server_settings"] = all_settings
-    _save(s)
+    _set("instance_server_settings", all_settings)
 
 
 # -- Remote server connections (HyRemote plugin) ------------------------------
@@ -286,6 +314,8 @@ def get_remote_connections() -> list[dict]:
 
 
 def set_remote_connections(connections: list[dict]) -> None:
+    # Callers edit connection dicts in place (shared with the cache), so an
+    # equality check can't detect changes here – always write.
     s = load()
     s["remote_connections"] = connections
     _save(s)
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import re
+import time
 from typing import Callable, Optional
 
 _PROGRESS_RE = re.compile(r"(\d+\.?\d*)%\s*\(([^)]+)\)")
 
+# Minimum spacing between forwarded progress updates (~8 per second). The
+# downloader prints a progress line per chunk; faster updates only cost repaints.
+_PROGRESS_INTERVAL_S = 0.125
+
 
 def parse_progress(line: str) -> tuple[float, str] | None:
+    if "%" not in line:
+        return None
     m = _PROGRESS_RE.search(line)
     if m:
         return float(m.group(1)), m.group(2).strip()
@@ -18,12 +25,40 @@ def parse_progress(line: str) -> tuple[float, str] | None:
 def make_dl_output_handler(
     on_status: Optional[Callable[[str], None]],
     on_progress: Optional[Callable[[float, str], None]],
+    *,
+    interval: float = _PROGRESS_INTERVAL_S,
 ) -> Callable[[str], None]:
+    """
+    Build the downloader ``on_output`` callback.
+
+    Progress lines are coalesced: at most one ``on_progress`` call per *interval*,
+    and only the newest line of a burst is forwarded; 100% is always sent at
+    once. A held-back update is delivered before the next status line, or by
+    ``handler.flush()`` once the download has finished.
+    """
+    pending: Optional[re.Match] = None
+    last_emit = 0.0
+
+    def _flush() -> None:
+        nonlocal pending
+        m, pending = pending, None
+        if m is not None and on_progress:
+            on_progress(float(m.group(1)), m.group(2).strip())
+
     def _handler(line: str):
-        prog = parse_progress(line)
-        if prog and on_progress:
-            on_progress(prog[0], prog[1])
-        elif on_status:
+        nonlocal pending, last_emit
+        m = _PROGRESS_RE.search(line) if on_progress and "%" in line else None
+        if m:
+            pending = m
+            now = time.monotonic()
+            # Completion is never held back, so the bar always reaches 100%.
+            if now - last_emit >= interval or float(m.group(1)) >= 100:
+                last_emit = now
+                _flush()
+            return
+        _flush()
+        if on_status:
             on_status(line)
 
+    _handler.flush = _flush  # type: ignore[attr-defined]
     return _handler
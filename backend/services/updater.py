@@ -7,13 +7,11 @@ import shutil
 import sys
 import threading
 import time
-import zipfile
 from typing import Callable, Optional
 
-from config import SERVER_DIR
+from config import SERVER_DIR, SERVER_ROOT_FILES
 from services import backup as bk
 from services import downloader as dl
-from services import nitrado_plugins as nitrado
 from services.update_progress import make_dl_output_handler, parse_progress
 from services.version_check import (
     get_all_instances_update_status,
@@ -104,6 +102,7 @@ def _ensure_cached_server(
     output_handler = make_dl_output_handler(on_status, on_progress)
 
     def _dl_done(rc):
+        output_handler.flush()
         dl_result["rc"] = rc
         done_event.set()
 
@@ -124,9 +123,39 @@ def _ensure_cached_server(
     return zip_path
 
 
+def _discard_dir(path: str) -> None:
+    """Move *path* aside and delete it on a background thread.
+    The rename is a single metadata op, so the caller can immediately reuse the
+    name while the (possibly large) tree is unlinked off the critical path."""
+    trash = f"{path}.old.{time.time_ns()}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}, daemon=True
+    ).start()
+
+
+def _sweep_discarded(path: str) -> None:
+    """Remove ``<path>.old.*`` leftovers whose background delete never finished
+    (e.g. the app exited right after an update)."""
+    parent, name = os.path.split(path)
+    try:
+        entries = os.listdir(parent)
+    except OSError:
+        return
+    prefix = f"{name}.old."
+    for entry in entries:
+        if entry.startswith(prefix):
+            shutil.rmtree(os.path.join(parent, entry), ignore_errors=True)
+
+
 def _extract_server_zip_to_instance(zip_path: str, instance_dir: str) -> None:
     """Extract server zip into the given instance directory."""
     temp_dir = os.path.join(instance_dir, "temp_extract")
+    _sweep_discarded(temp_dir)
     if os.path.isdir(temp_dir):
         shutil.rmtree(temp_dir)
     os.makedirs(temp_dir)
@@ -139,28 +168,32 @@ def _extract_server_zip_to_instance(zip_path: str, instance_dir: str) -> None:
         shutil.rmtree(temp_dir)
         raise RuntimeError("Unexpected zip structure – no Server folder found.")
 
+    # temp_extract lives inside the instance folder, so every member can be
+    # moved into place with a rename instead of being copied a second time.
     server_dir = os.path.join(instance_dir, SERVER_DIR)
+    os.makedirs(server_dir, exist_ok=True)
     for name in ("HytaleServer.jar", "HytaleServer.aot"):
         src = os.path.join(extracted_server, name)
         if os.path.isfile(src):
-            shutil.copy2(src, server_dir)
+            os.replace(src, os.path.join(server_dir, name))
 
     licenses_src = os.path.join(extracted_server, "Licenses")
     if os.path.isdir(licenses_src):
         licenses_dst = os.path.join(server_dir, "Licenses")
+        _sweep_discarded(licenses_dst)
         if os.path.isdir(licenses_dst):
-            shutil.rmtree(licenses_dst)
-        shutil.copytree(licenses_src, licenses_dst)
+            _discard_dir(licenses_dst)
+        os.replace(licenses_src, licenses_dst)
 
-    for name in ("Assets.zip", "start.bat", "start.sh"):
+    for name in SERVER_ROOT_FILES:
         src = os.path.join(temp_dir, name)
         dst = os.path.join(instance_dir, name)
         if os.path.isfile(src):
-            shutil.copy2(src, dst)
+            os.replace(src, dst)
             if name == "start.sh" and sys.platform != "win32":
                 os.chmod(dst, 0o755)
 
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    _discard_dir(temp_dir)
 
 
 def _looks_like_backup_path_failure(exc: Exception) -> bool:
@@ -202,12 +235,7 @@ def perform_update(
                             on_done(False, "Failed to stop server.", None)
                         return
                 else:
-                    server_svc.stop(instance_name=instance_name)
-                    for _ in range(30):
-                        if not server_svc.is_instance_running(instance_name):
-                            break
-                        time.sleep(1)
-                    if server_svc.is_instance_running(instance_name):
+                    if not server_svc.stop(instance_name=instance_name):
                         _set_update_in_progress(None)
                         if on_done:
                             on_done(False, "Server did not stop in time.", None)
@@ -341,6 +369,7 @@ def perform_first_time_setup(
             _extract_server_zip_to_instance(zip_path, instance_dir)
 
             # Install Nitrado plugins on first-time setup (new server has no mods yet)
+            from services import nitrado_plugins as nitrado
             nitrado.install_nitrado_plugins(os.path.join(instance_dir, SERVER_DIR), on_status=on_status)
 
             save_version_for_instance(instance_name, new_ver, patchline)
@@ -434,14 +463,7 @@ def _graceful_shutdown_with_warning(
                 return True
             time.sleep(1)
 
-    if server_svc.is_instance_running(inst):
-        server_svc.stop(instance_name=inst)
-        for _ in range(30):
-            if not server_svc.is_instance_running(inst):
-                return True
-            time.sleep(1)
-        return False
-    return True
+    return server_svc.stop(instance_name=inst)
 
 
 def perform_update_all(
@@ -467,7 +489,8 @@ def perform_update_all(
                     on_done(False, "No servers folder configured.", None)
                 return
 
-            status = get_all_instances_update_status()
+            # Decide on what the remote has right now, not the prefetched copy.
+            status = get_all_instances_update_status(force=True)
             instances_data = status.get("instances", {})
             to_update = [
                 (name, info)
@@ -512,12 +535,7 @@ def perform_update_all(
                                 errors.append(f"{instance_name}: failed to stop server")
                                 continue
                         else:
-                            server_svc.stop(instance_name=instance_name)
-                            for _ in range(30):
-                                if not server_svc.is_instance_running(instance_name):
-                                    break
-                                time.sleep(1)
-                            if server_svc.is_instance_running(instance_name):
+                            if not server_svc.stop(instance_name=instance_name):
                                 errors.append(f"{instance_name}: did not stop in time")
                                 continue
 
@@ -3,52 +3,133 @@
 from __future__ import annotations
 
 import os
+import sys
+import threading
+import time
 
 from config import PATCHLINE_FILE, VERSION_FILE
 from services import downloader as dl
 from utils.paths import resolve_instance, resolve_instance_by_name
 
+# Asking the downloader for remote versions runs it twice (~1s or more). Once
+# something has asked for update status, a background thread keeps a recent
+# answer around so later checks usually return from memory. Failed lookups
+# (auth, network) aren't kept, so they are retried on the next check.
+_REMOTE_PREFETCH_INTERVAL_S = 5 * 60
+_remote_cache: dict | None = None
+_remote_cached_at = 0.0
+_prefetch_started = False
+_prefetch_lock = threading.Lock()
+
+# Version/patchline markers are read on every status poll for every instance;
+# keep the last contents keyed by (mtime, size) so an unchanged file costs one stat.
+_marker_cache: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def _read_marker(path: str, default: str) -> str:
+    try:
+        st = os.stat(path)
+    except OSError:
+        _marker_cache.pop(path, None)
+        return default
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _marker_cache.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    try:
+        with open(path, "r") as f:
+            value = f.read().strip() or default
+    except OSError:
+        return default
+    _marker_cache[path] = (sig, value)
+    return value
+
+
+def _write_marker(path: str, value: str) -> None:
+    _marker_cache.pop(path, None)
+    with open(path, "w") as f:
+        f.write(value)
+
 
 def read_installed_version() -> str:
-    vf = resolve_instance(VERSION_FILE)
-    if os.path.isfile(vf):
-        with open(vf, "r") as f:
-            return f.read().strip() or "unknown"
-    return "unknown"
+    return _read_marker(resolve_instance(VERSION_FILE), "unknown")
 
 
 def read_installed_patchline() -> str:
-    pf = resolve_instance(PATCHLINE_FILE)
-    if os.path.isfile(pf):
-        with open(pf, "r") as f:
-            return f.read().strip() or "release"
-    return "release"
+    return _read_marker(resolve_instance(PATCHLINE_FILE), "release")
 
 
 def save_version(version: str, patchline: str) -> None:
-    with open(resolve_instance(VERSION_FILE), "w") as f:
-        f.write(version)
-    with open(resolve_instance(PATCHLINE_FILE), "w") as f:
-        f.write(patchline)
+    _write_marker(resolve_instance(VERSION_FILE), version)
+    _write_marker(resolve_instance(PATCHLINE_FILE), patchline)
 
 
-def check_remote_versions() -> dict:
+def _fetch_remote_versions(only_if_idle: bool = False) -> dict | None:
+    """Ask the downloader for both patchlines. With *only_if_idle*, returns
+    None if another downloader run is active."""
+    global _remote_cache, _remote_cached_at
     result = {}
     remote_error = None
     remote_error_kind = None
     for pl in ("release", "pre-release"):
-        rc, out = dl.print_version(pl)
-        ok = rc == 0 and out and not out.startswith("[ERROR]")
+        ran = dl.print_version(pl, only_if_idle=only_if_idle)
+        if ran is None:
+            return None
+        rc, out = ran
+        ok = rc == 0 and out and not dl.is_error_output(out)
         result[pl] = out.strip() if ok else None
         if not ok and remote_error is None:
             kind, msg = dl.classify_version_error(out or "")
             remote_error_kind = kind
             remote_error = msg
-    return {
+    info = {
         "versions": result,
         "remote_error": remote_error,
         "remote_error_kind": remote_error_kind,
     }
+    if remote_error is None:
+        _remote_cache, _remote_cached_at = info, time.time()
+    return info
+
+
+def check_remote_versions(max_age: float = _REMOTE_PREFETCH_INTERVAL_S) -> dict:
+    """
+    Remote release/pre-release versions, from the prefetched copy when it is
+    younger than *max_age*; pass ``max_age=0`` to always ask the downloader.
+    """
+    _start_remote_prefetch()
+    cached = _remote_cache
+    if cached is not None and 0 <= time.time() - _remote_cached_at < max_age:
+        return cached
+    return _fetch_remote_versions()
+
+
+def _prefetch_blocked() -> bool:
+    """Don't run the downloader next to an update or auth flow using the same credentials."""
+    from services.updater import get_update_in_progress
+
+    return dl.is_busy() or get_update_in_progress() is not None
+
+
+def _start_remote_prefetch() -> None:
+    """Refresh the remote versions every few minutes on a daemon thread (started once)."""
+    global _prefetch_started
+    with _prefetch_lock:
+        if _prefetch_started:
+            return
+        _prefetch_started = True
+
+    def _loop():
+        while True:
+            time.sleep(_REMOTE_PREFETCH_INTERVAL_S)
+            if _prefetch_blocked() or not (dl.has_downloader() and dl.has_credentials()):
+                continue
+            try:
+                _fetch_remote_versions(only_if_idle=True)
+            except Exception as e:
+                print(f"[version_check] Remote version prefetch failed: {e}", file=sys.stderr, flush=True)
+
+    threading.Thread(target=_loop, daemon=True, name="remote-version-prefetch").start()
 
 
 def version_greater(a: str, b: str) -> bool:
@@ -67,43 +148,46 @@ def version_less(a: str, b: str) -> bool:
     return a < b
 
 
-def get_update_status() -> dict:
-    iv = read_installed_version()
-    ip = read_installed_patchline()
-    remote_info = check_remote_versions()
-    remote = remote_info.get("versions", {})
-    rr = remote.get("release")
-    rp = remote.get("pre-release")
-
+def _instance_update_status(iv: str, ip: str, rr: str | None, rp: str | None) -> dict:
+    """Update/switch availability for one installed version against the remote versions."""
     if ip == "release":
         update_available = version_greater(rr, iv) if rr else False
     else:
         update_available = version_greater(rp, iv) if rp else False
-
     can_switch_release = ip == "pre-release" and rr is not None
     can_switch_prerelease = ip == "release" and rp is not None
-    switch_to_release_is_downgrade = can_switch_release and version_less(rr, iv)
-    switch_to_prerelease_is_downgrade = can_switch_prerelease and version_less(rp, iv)
-
     return {
+        "update_available": update_available,
         "installed_version": iv,
         "installed_patchline": ip,
+        "can_switch_release": can_switch_release,
+        "can_switch_prerelease": can_switch_prerelease,
+        "switch_to_release_is_downgrade": can_switch_release and version_less(rr, iv),
+        "switch_to_prerelease_is_downgrade": can_switch_prerelease and version_less(rp, iv),
+    }
+
+
+def get_update_status(force: bool = False) -> dict:
+    iv = read_installed_version()
+    ip = read_installed_patchline()
+    remote_info = check_remote_versions(max_age=0) if force else check_remote_versions()
+    remote = remote_info.get("versions", {})
+    rr = remote.get("release")
+    rp = remote.get("pre-release")
+
+    return {
         "remote_release": rr,
         "remote_prerelease": rp,
         "remote_error": remote_info.get("remote_error"),
         "remote_error_kind": remote_info.get("remote_error_kind"),
-        "update_available": update_available,
-        "can_switch_release": can_switch_release,
-        "can_switch_prerelease": can_switch_prerelease,
-        "switch_to_release_is_downgrade": switch_to_release_is_downgrade,
-        "switch_to_prerelease_is_downgrade": switch_to_prerelease_is_downgrade,
+        **_instance_update_status(iv, ip, rr, rp),
     }
 
 
-def get_all_instances_update_status() -> dict:
+def get_all_instances_update_status(force: bool = False) -> dict:
     from services import instances as inst_svc
 
-    remote_info = check_remote_versions()
+    remote_info = check_remote_versions(max_age=0) if force else check_remote_versions()
     remote = remote_info.get("versions", {})
     rr = remote.get("release")
     rp = remote.get("pre-release")
@@ -114,23 +198,7 @@ def get_all_instances_update_status() -> dict:
             continue
         iv = inst.get("version") or "unknown"
         ip = inst.get("patchline") or "release"
-        if ip == "release":
-            update_available = version_greater(rr, iv) if rr else False
-        else:
-            update_available = version_greater(rp, iv) if rp else False
-        can_switch_release = ip == "pre-release" and rr is not None
-        can_switch_prerelease = ip == "release" and rp is not None
-        switch_to_release_is_downgrade = can_switch_release and version_less(rr, iv)
-        switch_to_prerelease_is_downgrade = can_switch_prerelease and version_less(rp, iv)
-        result[inst["name"]] = {
-            "update_available": update_available,
-            "installed_version": iv,
-            "installed_patchline": ip,
-            "can_switch_release": can_switch_release,
-            "can_switch_prerelease": can_switch_prerelease,
-            "switch_to_release_is_downgrade": switch_to_release_is_downgrade,
-            "switch_to_prerelease_is_downgrade": switch_to_prerelease_is_downgrade,
-        }
+        result[inst["name"]] = _instance_update_status(iv, ip, rr, rp)
 
     return {
         "instances": result,
@@ -142,26 +210,16 @@ def get_all_instances_update_status() -> dict:
 
 
 def read_version_for_instance(instance_name: str) -> str:
-    vf = resolve_instance_by_name(instance_name, VERSION_FILE)
-    if os.path.isfile(vf):
-        with open(vf, "r") as f:
-            return f.read().strip() or "unknown"
-    return "unknown"
+    return _read_marker(resolve_instance_by_name(instance_name, VERSION_FILE), "unknown")
 
 
 def read_patchline_for_instance(instance_name: str) -> str:
-    pf = resolve_instance_by_name(instance_name, PATCHLINE_FILE)
-    if os.path.isfile(pf):
-        with open(pf, "r") as f:
-            return f.read().strip() or "release"
-    return "release"
+    return _read_marker(resolve_instance_by_name(instance_name, PATCHLINE_FILE), "release")
 
 
 def save_version_for_instance(instance_name: str, version: str, patchline: str) -> None:
     vf = resolve_instance_by_name(instance_name, VERSION_FILE)
     pf = resolve_instance_by_name(instance_name, PATCHLINE_FILE)
     os.makedirs(os.path.dirname(vf), exist_ok=True)
-    with open(vf, "w") as f:
-        f.write(version)
-    with open(pf, "w") as f:
-        f.write(patchline)
+    _write_marker(vf, version)
+    _write_marker(pf, patchline)
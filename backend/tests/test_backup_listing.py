@@ -0,0 +1,61 @@
+"""Tests for backup listing and entry reuse."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def backup_module(monkeypatch, tmp_path):
+    import services.backup as mod
+
+    monkeypatch.setattr(mod, "resolve_instance", lambda *parts: os.path.join(str(tmp_path), *parts))
+    monkeypatch.setattr(mod, "_entry_cache", {})
+    return mod, tmp_path / "backups"
+
+
+def test_list_backups_reuses_unchanged_entries(backup_module):
+    mod, backup_root = backup_module
+    (backup_root / "backup_a" / "Server").mkdir(parents=True)
+
+    first = mod.list_backups()
+    second = mod.list_backups()
+
+    assert len(first) == 1
+    assert first[0] is second[0]
+
+
+def test_list_backups_reloads_after_rename(backup_module):
+    mod, backup_root = backup_module
+    (backup_root / "backup_a" / "Server").mkdir(parents=True)
+
+    entry = mod.list_backups()[0]
+    mod.rename_backup(entry, "Before big change")
+    renamed = mod.list_backups()[0]
+
+    assert renamed.label == "Before big change"
+
+
+def test_list_backups_drops_removed_folders(backup_module):
+    mod, backup_root = backup_module
+    (backup_root / "backup_a" / "Server").mkdir(parents=True)
+
+    entry = mod.list_backups()[0]
+    mod.delete_backup(entry)
+
+    assert mod.list_backups() == []
+    assert mod._entry_cache == {}
+
+
+def test_create_backup_copies_server_and_records_label(backup_module):
+    mod, backup_root = backup_module
+    server = backup_root.parent / "Server"
+    server.mkdir()
+    (server / "HytaleServer.jar").write_bytes(b"jar")
+    (backup_root.parent / "start.sh").write_text("#!/bin/sh\n")
+
+    entry = mod.create_backup(label="Before big change")
+
+    assert entry.label == "Before big change"
+    assert (backup_root / entry.folder_name / "Server" / "HytaleServer.jar").is_file()
+    assert (backup_root / entry.folder_name / "start.sh").is_file()
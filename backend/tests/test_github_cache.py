@@ -0,0 +1,93 @@
+"""Tests for the conditional-request GitHub cache."""
+
+import time
+
+import pytest
+import requests
+
+URL = "https://api.github.com/repos/example/project/releases/latest"
+
+
+class _Response:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def json(self):
+        return self._body
+
+
+class _Session:
+    def __init__(self):
+        self.replies = []
+        self.calls = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.calls.append(headers or {})
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+@pytest.fixture
+def cache_module(monkeypatch, tmp_path):
+    import services.github_cache as mod
+
+    session = _Session()
+    monkeypatch.setattr(mod, "_session", session)
+    monkeypatch.setattr(mod, "_CACHE_FILE", str(tmp_path / "github.json"))
+    monkeypatch.setattr(mod, "_entries", {})
+    return mod, session
+
+
+def _store(mod, fetched_at, body=None):
+    mod._entries[URL] = {"etag": '"v1"', "last_modified": None, "body": body or {"tag": "v1"}, "fetched_at": fetched_at}
+
+
+def test_fresh_entry_is_returned_without_a_request(cache_module):
+    mod, session = cache_module
+    _store(mod, time.time())
+
+    assert mod.get_json(URL) == {"tag": "v1"}
+    assert session.calls == []
+
+
+def test_not_modified_reuses_body_and_refreshes_timestamp(cache_module):
+    mod, session = cache_module
+    _store(mod, time.time() - mod._FRESH_TTL_S - 1)
+    session.replies.append(_Response(304))
+
+    assert mod.get_json(URL) == {"tag": "v1"}
+    assert session.calls[0]["If-None-Match"] == '"v1"'
+    assert time.time() - mod._entries[URL]["fetched_at"] < mod._FRESH_TTL_S
+
+    mod.get_json(URL)
+    assert len(session.calls) == 1
+
+
+def test_max_age_zero_forces_revalidation(cache_module):
+    mod, session = cache_module
+    _store(mod, time.time())
+    session.replies.append(_Response(200, {"tag": "v2"}, {"ETag": '"v2"'}))
+
+    assert mod.get_json(URL, max_age=0) == {"tag": "v2"}
+    assert len(session.calls) == 1
+    assert mod._entries[URL]["etag"] == '"v2"'
+
+
+def test_failed_request_falls_back_to_stored_body_only_when_stale_ok(cache_module):
+    mod, session = cache_module
+    _store(mod, time.time() - mod._FRESH_TTL_S - 1)
+    session.replies.append(requests.ConnectionError("offline"))
+
+    assert mod.get_json(URL, stale_ok=True, backoff_s=0) == {"tag": "v1"}
+
+    session.replies.append(requests.ConnectionError("offline"))
+    with pytest.raises(requests.ConnectionError):
+        mod.get_json(URL, backoff_s=0)
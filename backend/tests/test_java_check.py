@@ -0,0 +1,38 @@
+"""Tests for the memoized Java probe."""
+
+import pytest
+
+
+@pytest.fixture
+def java_module(monkeypatch):
+    import utils.java as mod
+
+    monkeypatch.setattr(mod, "_java_cache", None)
+    monkeypatch.setattr(mod, "_java_cached_at", 0.0)
+    return mod
+
+
+def test_found_java_is_memoized(java_module, monkeypatch):
+    calls = []
+    monkeypatch.setattr(java_module, "_probe_java", lambda: calls.append(1) or (True, "openjdk 25"))
+
+    assert java_module.check_java() == (True, "openjdk 25")
+    assert java_module.check_java() == (True, "openjdk 25")
+    assert len(calls) == 1
+
+    java_module.invalidate_java_cache()
+    java_module.check_java()
+    assert len(calls) == 2
+
+
+def test_missing_java_is_rechecked_after_ttl(java_module, monkeypatch):
+    calls = []
+    monkeypatch.setattr(java_module, "_probe_java", lambda: calls.append(1) or (False, "Java not found"))
+
+    java_module.check_java()
+    java_module.check_java()
+    assert len(calls) == 1
+
+    monkeypatch.setattr(java_module, "_java_cached_at", java_module._java_cached_at - java_module._JAVA_MISSING_TTL_S)
+    java_module.check_java()
+    assert len(calls) == 2
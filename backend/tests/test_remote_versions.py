@@ -0,0 +1,60 @@
+"""Tests for the prefetched remote version lookup."""
+
+import pytest
+
+
+@pytest.fixture
+def version_module(monkeypatch):
+    import services.version_check as mod
+
+    monkeypatch.setattr(mod, "_remote_cache", None)
+    monkeypatch.setattr(mod, "_remote_cached_at", 0.0)
+    monkeypatch.setattr(mod, "_prefetch_started", True)
+    return mod
+
+
+def test_recent_remote_versions_are_reused(version_module, monkeypatch):
+    calls = []
+    monkeypatch.setattr(version_module.dl, "print_version", lambda pl, **kw: calls.append(pl) or (0, "2026.01.01-abc\n"))
+
+    first = version_module.check_remote_versions()
+    second = version_module.check_remote_versions()
+
+    assert first["versions"] == {"release": "2026.01.01-abc", "pre-release": "2026.01.01-abc"}
+    assert second is first
+    assert calls == ["release", "pre-release"]
+
+    version_module.check_remote_versions(max_age=0)
+    assert len(calls) == 4
+
+
+def test_failed_remote_lookup_is_not_kept(version_module, monkeypatch):
+    calls = []
+    monkeypatch.setattr(version_module.dl, "print_version", lambda pl, **kw: calls.append(pl) or (1, "[ERROR] no auth"))
+    monkeypatch.setattr(version_module.dl, "classify_version_error", lambda out: ("auth", "Not signed in"))
+
+    assert version_module.check_remote_versions()["remote_error"] == "Not signed in"
+    version_module.check_remote_versions()
+    assert len(calls) == 4
+
+
+def test_prefetch_waits_for_downloader_runs(version_module, monkeypatch):
+    import services.updater as updater
+
+    monkeypatch.setattr(updater, "_update_in_progress", None)
+    assert not version_module._prefetch_blocked()
+
+    done = version_module.dl._track_run(None)
+    assert version_module._prefetch_blocked()
+    done(0)
+    assert not version_module._prefetch_blocked()
+
+
+def test_prefetch_does_not_start_next_to_a_downloader_run(version_module, monkeypatch):
+    monkeypatch.setattr(version_module.dl, "run_capture", lambda *a, **kw: (0, "2026.01.01-abc"))
+
+    done = version_module.dl._track_run(None)
+    assert version_module._fetch_remote_versions(only_if_idle=True) is None
+    done(0)
+
+    assert version_module._fetch_remote_versions(only_if_idle=True)["versions"]["release"] == "2026.01.01-abc"
@@ -27,3 +27,16 @@ def test_safe_extractall_rejects_path_traversal():
             zf.writestr("../outside.txt", b"no")
         with pytest.raises(ValueError, match="Unsafe"):
             safe_extractall(zpath, dest)
+
+
+def test_safe_extractall_streams_large_member_intact():
+    payload = os.urandom(3 * (1 << 20) + 123)
+    with tempfile.TemporaryDirectory() as tmp:
+        zpath = os.path.join(tmp, "big.zip")
+        dest = os.path.join(tmp, "out")
+        os.makedirs(dest)
+        with zipfile.ZipFile(zpath, "w") as zf:
+            zf.writestr("Server/big.bin", payload)
+        safe_extractall(zpath, dest)
+        with open(os.path.join(dest, "Server", "big.bin"), "rb") as f:
+            assert f.read() == payload
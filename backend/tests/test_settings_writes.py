@@ -0,0 +1,76 @@
+"""Tests for settings setters skipping redundant writes."""
+
+import pytest
+
+
+@pytest.fixture
+def settings_module(monkeypatch, tmp_path):
+    settings_dir = tmp_path / "HytaleServerManager"
+    settings_dir.mkdir(parents=True, exist_ok=True)
+    settings_file = settings_dir / "settings.json"
+
+    import services.settings as mod
+
+    monkeypatch.setattr(mod, "_SETTINGS_DIR", str(settings_dir))
+    monkeypatch.setattr(mod, "_SETTINGS_FILE", str(settings_file))
+    monkeypatch.setattr(mod, "_cache", None)
+    monkeypatch.setattr(mod, "_migrated", False)
+    return mod
+
+
+def test_setting_same_value_skips_write(settings_module, monkeypatch):
+    mod = settings_module
+    mod.set_active_instance("Survival")
+
+    writes = []
+    real_save = mod._save
+    monkeypatch.setattr(mod, "_save", lambda data: (writes.append(data), real_save(data)))
+
+    mod.set_active_instance("Survival")
+    mod.set_instance_port("Survival", 5520, 5620)
+    mod.set_instance_port("Survival", 5520, 5620)
+
+    assert len(writes) == 1
+    assert mod.get_instance_port("Survival") == (5520, 5620)
+
+
+def test_batch_writes_once(settings_module, monkeypatch):
+    mod = settings_module
+    mod.load()
+
+    writes = []
+    real_write = mod._write
+    monkeypatch.setattr(mod, "_write", lambda data: (writes.append(data), real_write(data)))
+
+    with mod.batch():
+        mod.set_active_instance("Survival")
+        mod.set_instance_port("Survival", 5520, 5620)
+        mod.set_experimental_addon_feature_flags({"backups": False})
+        assert writes == []
+
+    assert len(writes) == 1
+    mod._cache = None
+    assert mod.get_active_instance() == "Survival"
+    assert mod.get_instance_port("Survival") == (5520, 5620)
+
+
+def test_batch_does_not_defer_other_threads(settings_module, monkeypatch):
+    import threading
+
+    mod = settings_module
+    mod.load()
+
+    writes = []
+    real_write = mod._write
+    monkeypatch.setattr(mod, "_write", lambda data: (writes.append(data), real_write(data)))
+
+    with mod.batch():
+        t = threading.Thread(target=mod.set_active_instance, args=("Creative",))
+        t.start()
+        t.join()
+        assert len(writes) == 1
+
+    assert len(writes) == 1
+    with mod.batch():
+        mod.set_active_instance("Survival")
+    assert len(writes) == 2
@@ -0,0 +1,45 @@
+"""Tests for downloader progress parsing and coalescing."""
+
+from services.update_progress import make_dl_output_handler, parse_progress
+
+
+def test_parse_progress():
+    assert parse_progress("[====] 42.5% (10 MB / 24 MB)") == (42.5, "10 MB / 24 MB")
+    assert parse_progress("Validating files...") is None
+
+
+def test_handler_coalesces_progress_bursts():
+    statuses: list[str] = []
+    progress: list[tuple[float, str]] = []
+    handler = make_dl_output_handler(statuses.append, lambda p, d: progress.append((p, d)), interval=60)
+
+    for i in range(1, 11):
+        handler(f"{i}.0% ({i} MB / 10 MB)")
+    assert progress == [(1.0, "1 MB / 10 MB")]
+
+    handler.flush()
+    assert progress[-1] == (10.0, "10 MB / 10 MB")
+    assert len(progress) == 2
+    assert statuses == []
+
+
+def test_handler_delivers_pending_progress_before_status():
+    events: list[object] = []
+    handler = make_dl_output_handler(events.append, lambda p, d: events.append(p), interval=60)
+
+    handler("10.0% (1 MB / 10 MB)")
+    handler("50.0% (5 MB / 10 MB)")
+    handler("Download complete")
+
+    assert events == [10.0, 50.0, "Download complete"]
+
+
+def test_handler_forwards_completion_immediately():
+    progress: list[float] = []
+    handler = make_dl_output_handler(None, lambda p, d: progress.append(p), interval=60)
+
+    handler("5.0% (1 MB / 20 MB)")
+    handler("60.0% (12 MB / 20 MB)")
+    handler("100.0% (20 MB / 20 MB)")
+
+    assert progress == [5.0, 100.0]
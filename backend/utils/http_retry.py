@@ -1,27 +1,19 @@
-"""Small helper for retried HTTP GET requests."""
+"""Small helper for retrying flaky HTTP calls."""
 
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import Callable, TypeVar
 
-import requests
+T = TypeVar("T")
 
 
-def get_json_with_retry(
-    url: str,
-    *,
-    timeout: float = 8,
-    retries: int = 3,
-    backoff_s: float = 0.5,
-    headers: dict[str, str] | None = None,
-) -> dict[str, Any]:
+def with_retry(fn: Callable[[], T], *, retries: int = 3, backoff_s: float = 0.5) -> T:
+    """Call *fn* up to *retries* times with a linear backoff. Raises the last error."""
     last_err: Exception | None = None
     for attempt in range(retries):
         try:
-            resp = requests.get(url, timeout=timeout, headers=headers)
-            resp.raise_for_status()
-            return resp.json()
+            return fn()
         except Exception as e:
             last_err = e
             if attempt < retries - 1:
@@ -4,32 +4,85 @@ Java detection utility.
 
 import subprocess
 import sys
+import threading
+import time
 
 _CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0) if sys.platform == "win32" else 0
 
+# /api/info is fetched on every view mount and the JVM probe is a fork+exec that
+# can take hundreds of ms. A found Java doesn't go away during a session, so a
+# successful probe is kept for the life of the process; a failed one is retried
+# after a short while so installing Java doesn't require restarting the manager.
+_JAVA_MISSING_TTL_S = 60
+_java_cache: tuple[bool, str] | None = None
+_java_cached_at = 0.0
+_probe_lock = threading.Lock()
+
+
+def _cached_result(now: float) -> tuple[bool, str] | None:
+    cached = _java_cache
+    if cached is not None and (cached[0] or (now - _java_cached_at) < _JAVA_MISSING_TTL_S):
+        return cached
+    return None
+
 
 def check_java() -> tuple[bool, str]:
     """
     Check if Java is available on PATH.
-    Returns ``(found, version_string)``.
+    Returns ``(found, version_string)``. A positive result is memoized until
+    :func:`invalidate_java_cache` is called.
     """
+    global _java_cache, _java_cached_at
+    cached = _cached_result(time.time())
+    if cached is not None:
+        return cached
+    # One probe at a time: a caller arriving mid-probe waits and reuses the result.
+    with _probe_lock:
+        cached = _cached_result(time.time())
+        if cached is not None:
+            return cached
+        _java_cache = _probe_java()
+        _java_cached_at = time.time()
+        return _java_cache
+
+
+def warm_java_cache() -> None:
+    """Start the Java probe in the background so the first /api/info doesn't wait on the JVM."""
+    threading.Thread(target=check_java, daemon=True, name="java-probe").start()
+
+
+def invalidate_java_cache() -> None:
+    """Forget the memoized probe (e.g. after the user points at a different JDK)."""
+    global _java_cache, _java_cached_at
+    _java_cache = None
+    _java_cached_at = 0.0
+
+
+def _probe_java() -> tuple[bool, str]:
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["java", "-version"],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-            timeout=10,
             creationflags=_CREATION_FLAGS,
         )
-        output = result.stdout.strip() or "(no output)"
-        if result.returncode == 0:
-            first_line = output.splitlines()[0] if output else "unknown"
-            return True, first_line
-        return False, output
     except FileNotFoundError:
         return False, "Java not found on PATH. Install Java 25+ from https://adoptium.net"
-    except subprocess.TimeoutExpired:
-        return False, "Java check timed out."
     except Exception as exc:
         return False, f"Error checking Java: {exc}"
+    with proc:
+        try:
+            stdout, _ = proc.communicate(timeout=10)
+        except subprocess.TimeoutExpired:
+            # Don't leave a hung JVM behind; reap it before reporting.
+            proc.kill()
+            proc.communicate()
+            return False, "Java check timed out."
+        except Exception as exc:
+            proc.kill()
+            return False, f"Error checking Java: {exc}"
+    output = (stdout or "").strip() or "(no output)"
+    if proc.returncode == 0:
+        return True, output.partition("\n")[0].strip() or "unknown"
+    return False, output
@@ -6,26 +6,34 @@ Two resolvers exist:
   - resolve_instance() → paths relative to the active instance folder (Server, backups, configs)
 """
 
+import functools
 import os
 
 from services.settings import get_root_dir, get_active_instance_dir
 
 
+# The base folder is part of the key, so switching root or active instance
+# never returns a stale path; only the repeated string joins are saved.
+@functools.lru_cache(maxsize=256)
+def _join(base: str, *parts: str) -> str:
+    return os.path.join(base, *parts)
+
+
 def resolve_root(*parts: str) -> str:
     """Join *parts* onto the root folder (shared downloader / credentials)."""
-    return os.path.join(get_root_dir(), *parts)
+    return _join(get_root_dir(), *parts)
 
 
 def resolve_instance(*parts: str) -> str:
     """Join *parts* onto the active instance folder (Server, backups, version files)."""
-    return os.path.join(get_active_instance_dir(), *parts)
+    return _join(get_active_instance_dir(), *parts)
 
 
 def resolve_instance_by_name(instance_name: str, *parts: str) -> str:
     """Join *parts* onto the given instance folder (for multi-server operations)."""
     root = get_root_dir()
     if root and instance_name:
-        return os.path.join(root, instance_name, *parts)
+        return _join(root, instance_name, *parts)
     return ""
 
 
@@ -33,10 +41,18 @@ def resolve_cache(patchline: str, *parts: str) -> str:
     """Join *parts* onto the shared server download cache for this patchline.
     Cache is at root/.server-cache/{patchline}/ so the same release is reused across instances.
     """
-    return os.path.join(get_root_dir(), ".server-cache", patchline, *parts)
+    return _join(get_root_dir(), ".server-cache", patchline, *parts)
+
+
+# Directories already created this session. A hit is confirmed with a single
+# stat instead of makedirs' walk, and the folder is recreated if it was removed.
+_ensured_dirs: set[str] = set()
 
 
 def ensure_dir(path: str) -> str:
     """Create *path* (and parents) if it doesn't exist.  Returns the path."""
+    if path in _ensured_dirs and os.path.isdir(path):
+        return path
     os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
     return path
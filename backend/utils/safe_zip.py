@@ -3,8 +3,13 @@ Safe ZIP extraction – reject path traversal (Zip Slip) and absolute paths.
 """
 
 import os
+import shutil
 import zipfile
 
+# Members are streamed in fixed-size chunks so a multi-GB entry (Assets.zip)
+# never has to be held in memory in one piece.
+_COPY_CHUNK = 1 << 20
+
 
 def safe_extractall(zip_path: str, dest_dir: str) -> None:
     """
@@ -32,5 +37,5 @@ def safe_extractall(zip_path: str, dest_dir: str) -> None:
                 os.makedirs(target, exist_ok=True)
             else:
                 os.makedirs(os.path.dirname(target), exist_ok=True)
-                with zf.open(name) as src, open(target, "wb") as dst:
-                    dst.write(src.read())
+                with zf.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, _COPY_CHUNK)
@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { lazy, Suspense, useState } from "react";
 import { AppSidebar, type ViewName } from "@/components/AppSidebar";
 import { AuthExpiredBanner } from "@/components/AuthExpiredBanner";
 import { DownloaderMissingBanner } from "@/components/DownloaderMissingBanner";
@@ -8,10 +8,7 @@ import { UpdateView } from "@/views/UpdateView";
 import { BackupView } from "@/views/BackupView";
 import { ModsView } from "@/views/ModsView";
 import { ConfigView } from "@/views/ConfigView";
-import { PortForwardingView } from "@/views/PortForwardingView";
 import { SettingsView } from "@/views/SettingsView";
-import { ExperimentalView } from "@/views/ExperimentalView";
-import { RemoteView } from "@/views/RemoteView";
 import { OnboardingView } from "@/views/OnboardingView";
 import { AuthRequiredView } from "@/views/AuthRequiredView";
 import { AddServerDialog } from "@/components/AddServerDialog";
@@ -25,6 +22,18 @@ import { clearBackendUrlCache } from "@/api/client";
 import { useAggregatedPendingUpdates } from "@/api/hooks/useAggregatedUpdates";
 import { useAppInfo } from "@/api/hooks/useInfo";
 
+// Rarely visited views are split into their own chunks and only fetched the
+// first time the user opens them, so they don't weigh on startup.
+const PortForwardingView = lazy(() =>
+  import("@/views/PortForwardingView").then((m) => ({ default: m.PortForwardingView }))
+);
+const ExperimentalView = lazy(() =>
+  import("@/views/ExperimentalView").then((m) => ({ default: m.ExperimentalView }))
+);
+const RemoteView = lazy(() =>
+  import("@/views/RemoteView").then((m) => ({ default: m.RemoteView }))
+);
+
 export default function App() {
   const { data: settings, isLoading, isError, error: settingsError, refetch } = useSettings();
   const { data: authStatus, isLoading: authLoading, isError: authError, refetch: refetchAuth } = useAuthStatus();
@@ -139,6 +148,7 @@ export default function App() {
             onNavigateToSettings={() => handleNavigate("settings")}
           />
           <div className="flex-1 overflow-y-auto">
+          <Suspense fallback={null}>
           {activeView === "dashboard" && (
             <DashboardView
               onNavigate={handleNavigate}
@@ -165,6 +175,7 @@ export default function App() {
           )}
           {appInfo?.remote_enabled && activeView === "remote" && <RemoteView />}
           {activeView === "settings" && <SettingsView />}
+          </Suspense>
           </div>
         </main>
       </div>
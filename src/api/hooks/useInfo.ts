@@ -1,4 +1,5 @@
-import { useQuery } from "@tanstack/react-query";
+import { useCallback } from "react";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
 import { api } from "../client";
 import type { AppInfo, ManagerUpdateInfo } from "../types";
 
@@ -13,10 +14,28 @@ export function useManagerUpdate() {
   return useQuery<ManagerUpdateInfo>({
     queryKey: ["info", "manager-update"],
     queryFn: () => api("/api/info/manager-update"),
-    staleTime: 5 * 60 * 1000, // cache for 5 minutes
+    // Checked once per session; the Updates view's Refresh forces a new check
+    // through useRefreshManagerUpdate (?refresh=1 bypasses the backend cache).
+    staleTime: Infinity,
   });
 }
 
+/** Ask the backend to bypass its cached release info and check GitHub again. */
+export function useRefreshManagerUpdate() {
+  const queryClient = useQueryClient();
+  return useCallback(
+    () =>
+      queryClient
+        .fetchQuery<ManagerUpdateInfo>({
+          queryKey: ["info", "manager-update"],
+          queryFn: () => api("/api/info/manager-update?refresh=1"),
+          staleTime: 0,
+        })
+        .catch(() => undefined),
+    [queryClient]
+  );
+}
+
 export function useLocalIp(enabled = true) {
   return useQuery<{ ip: string | null; ok: boolean }>({
     queryKey: ["info", "local-ip"],
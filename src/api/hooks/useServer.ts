@@ -36,10 +36,9 @@ export function useStopServer() {
         method: "POST",
         body: instance ? JSON.stringify({ instance }) : undefined,
       }),
-    onSuccess: () => {
-      setTimeout(() => {
-        qc.invalidateQueries({ queryKey: ["server", "status"] });
-      }, 1000);
+    // /api/server/stop returns once the process has exited (or failed to), so status is already final.
+    onSettled: () => {
+      qc.invalidateQueries({ queryKey: ["server", "status"] });
     },
   });
 }
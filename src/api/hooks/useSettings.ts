@@ -32,7 +32,7 @@ export function useUpdateSettings() {
         variables.experimental_addon_feature_flags !== undefined ||
         variables.experimental_addon_license_key !== undefined
       ) {
-        qc.invalidateQueries({ queryKey: ["info"] });
+        qc.invalidateQueries({ queryKey: ["info"], exact: true });
       }
       if (variables.instance_name) {
         qc.invalidateQueries({ queryKey: ["instances"] });
@@ -1,4 +1,5 @@
-import { useQuery, useMutation } from "@tanstack/react-query";
+import { useCallback } from "react";
+import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { api } from "../client";
 import { useSettings } from "./useSettings";
 import { useInstances } from "./useInstances";
@@ -33,6 +34,22 @@ export function useAllInstancesUpdateStatus() {
   });
 }
 
+/** Refetch all-instances status with fresh remote versions (skips the backend's prefetched copy). */
+export function useRefreshAllInstancesUpdateStatus() {
+  const queryClient = useQueryClient();
+  return useCallback(
+    () =>
+      queryClient
+        .fetchQuery<AllInstancesUpdateStatus>({
+          queryKey: ["updater", "all-instances"],
+          queryFn: () => api("/api/updater/check-all?refresh=1"),
+          staleTime: 0,
+        })
+        .catch(() => undefined),
+    [queryClient]
+  );
+}
+
 export function useUpdaterLocalStatus() {
   const { data: settings } = useSettings();
   const activeInstance = settings?.active_instance;
@@ -9,12 +9,14 @@ import {
 } from "@/components/ui/dialog";
 import { Button } from "@/components/ui/button";
 import { Label } from "@/components/ui/label";
-import { RadioGroup, RadioGroupItem } from "@/components/ui/radio-group";
 import { Progress } from "@/components/ui/progress";
+import { ChannelRadioGroup } from "@/components/ChannelRadioGroup";
+import { InstallStuckNotice } from "@/components/InstallStuckNotice";
 import { useQueryClient } from "@tanstack/react-query";
 import { useCreateInstance } from "@/api/hooks/useInstances";
 import { toast } from "sonner";
 import { subscribeSSE } from "@/api/client";
+import { formatPercent } from "@/lib/utils";
 
 const STUCK_TIMEOUT_MS = 30_000; // 30 seconds with no progress = show Cancel
 
@@ -176,23 +178,7 @@ export function AddServerDialog({ open, onOpenChange }: Props) {
               />
             </div>
 
-            <div className="space-y-2">
-              <Label>Update Channel</Label>
-              <RadioGroup value={channel} onValueChange={setChannel}>
-                <div className="flex items-center space-x-2">
-                  <RadioGroupItem value="release" id="add-ch-release" />
-                  <Label htmlFor="add-ch-release">
-                    Release (recommended, stable)
-                  </Label>
-                </div>
-                <div className="flex items-center space-x-2">
-                  <RadioGroupItem value="pre-release" id="add-ch-pre" />
-                  <Label htmlFor="add-ch-pre">
-                    Pre-Release (experimental)
-                  </Label>
-                </div>
-              </RadioGroup>
-            </div>
+            <ChannelRadioGroup value={channel} onValueChange={setChannel} idPrefix="add" />
 
             {createInstance.isError && (
               <p className="text-sm text-red-500">
@@ -222,7 +208,7 @@ export function AddServerDialog({ open, onOpenChange }: Props) {
             <div className="flex items-center gap-3">
               <Progress value={progress} className="flex-1 h-3" />
               <span className="text-sm font-medium w-12 text-right">
-                {Math.round(progress)}%
+                {formatPercent(progress)}
               </span>
             </div>
             {detail && (
@@ -233,61 +219,7 @@ export function AddServerDialog({ open, onOpenChange }: Props) {
                 Cancel
               </Button>
             </DialogFooter>
-            {stuck && (
-              <div className="space-y-2 rounded-md border border-amber-500/50 bg-amber-500/10 p-3">
-                <p className="text-sm text-amber-600 dark:text-amber-400">
-                  Taking longer than expected. Possible causes:
-                </p>
-                <ul className="text-xs text-muted-foreground list-disc list-inside space-y-0.5">
-                  <li>Network or firewall blocking the download</li>
-                  <li>Auth expired – try Refresh Auth in Settings</li>
-                </ul>
-                <div className="pt-1 flex flex-wrap gap-2">
-                  <Button
-                    variant="ghost"
-                    size="sm"
-                    className="h-7 text-xs"
-                    onClick={async () => {
-                      try {
-                        const { api } = await import("@/api/client");
-                        const res = await api<{ logs: string }>("/api/debug/recent-logs");
-                        const header = `--- Add server stuck, no output ---\nFrontend log: ${statusLog.join(" | ") || "(none)"}\n\nBackend logs:\n`;
-                        await navigator.clipboard.writeText(header + (res?.logs ?? "(failed to fetch)"));
-                        toast.success("Debug info copied");
-                      } catch {
-                        const header = `--- Add server stuck ---\nFrontend: ${statusLog.join(" | ") || "no output"}\n`;
-                        await navigator.clipboard.writeText(header);
-                        toast.success("Debug info copied");
-                      }
-                    }}
-                  >
-                    Copy debug info
-                  </Button>
-                  {statusLog.length > 0 && (
-                    <Button
-                      variant="ghost"
-                      size="sm"
-                      className="h-7 text-xs"
-                      onClick={() => {
-                        navigator.clipboard.writeText(statusLog.join("\n"));
-                        toast.success("Log copied");
-                      }}
-                    >
-                      Copy frontend log
-                    </Button>
-                  )}
-                </div>
-                {statusLog.length > 0 ? (
-                  <pre className="text-xs text-muted-foreground font-mono bg-background/50 rounded p-2 max-h-24 overflow-y-auto whitespace-pre-wrap break-words">
-                    {statusLog.join("\n")}
-                  </pre>
-                ) : (
-                  <p className="text-xs text-muted-foreground pt-1">
-                    No output received. Copy debug info and share when reporting the issue.
-                  </p>
-                )}
-              </div>
-            )}
+            {stuck && <InstallStuckNotice operation="Add server" statusLog={statusLog} />}
           </div>
         )}
 
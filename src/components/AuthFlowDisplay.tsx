@@ -3,6 +3,7 @@ import { toast } from "sonner";
 import { Button } from "@/components/ui/button";
 import { LogConsole } from "@/components/LogConsole";
 import { formatAuthCode, parseAuthOutput } from "@/lib/authOutput";
+import { cn } from "@/lib/utils";
 import { ExternalLink, Copy, ChevronDown, ChevronUp } from "lucide-react";
 
 interface AuthFlowDisplayProps {
@@ -12,6 +13,9 @@ interface AuthFlowDisplayProps {
 
 export function AuthFlowDisplay({ lines, className }: AuthFlowDisplayProps) {
   const [showConsole, setShowConsole] = useState(false);
+  // Mounted on first reveal, then only hidden, so toggling keeps its scroll position
+  // and doesn't rebuild every line.
+  const [consoleMounted, setConsoleMounted] = useState(false);
   const parsed = parseAuthOutput(lines);
   const displayCode = parsed.code ? formatAuthCode(parsed.code) : null;
 
@@ -127,7 +131,10 @@ export function AuthFlowDisplay({ lines, className }: AuthFlowDisplayProps) {
           variant="ghost"
           size="sm"
           className="h-8 text-muted-foreground hover:text-foreground"
-          onClick={() => setShowConsole(!showConsole)}
+          onClick={() => {
+            setShowConsole(!showConsole);
+            setConsoleMounted(true);
+          }}
         >
           {showConsole ? (
             <ChevronUp className="h-4 w-4 mr-1" />
@@ -136,8 +143,11 @@ export function AuthFlowDisplay({ lines, className }: AuthFlowDisplayProps) {
           )}
           {showConsole ? "Hide" : "Show"} console
         </Button>
-        {showConsole && (
-          <LogConsole lines={lines} className="h-[140px]" />
+        {consoleMounted && (
+          <LogConsole
+            lines={lines}
+            className={cn("h-[140px]", !showConsole && "hidden")}
+          />
         )}
       </div>
     </div>
@@ -0,0 +1,31 @@
+import { Label } from "@/components/ui/label";
+import { RadioGroup, RadioGroupItem } from "@/components/ui/radio-group";
+
+interface ChannelRadioGroupProps {
+  value: string;
+  onValueChange: (value: string) => void;
+  /** Prefix for the radio ids so labels stay unique when several dialogs exist. */
+  idPrefix: string;
+}
+
+export function ChannelRadioGroup({ value, onValueChange, idPrefix }: ChannelRadioGroupProps) {
+  return (
+    <div className="space-y-2">
+      <Label>Update Channel</Label>
+      <RadioGroup value={value} onValueChange={onValueChange}>
+        <div className="flex items-center space-x-2">
+          <RadioGroupItem value="release" id={`${idPrefix}-ch-release`} />
+          <Label htmlFor={`${idPrefix}-ch-release`}>
+            Release (recommended, stable)
+          </Label>
+        </div>
+        <div className="flex items-center space-x-2">
+          <RadioGroupItem value="pre-release" id={`${idPrefix}-ch-pre`} />
+          <Label htmlFor={`${idPrefix}-ch-pre`}>
+            Pre-Release (experimental)
+          </Label>
+        </div>
+      </RadioGroup>
+    </div>
+  );
+}
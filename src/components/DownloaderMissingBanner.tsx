@@ -41,7 +41,7 @@ export function DownloaderMissingBanner({ onNavigateToSettings }: { onNavigateTo
             const ok = d.ok as boolean;
             const msg = d.message as string;
             setFetching(false);
-            queryClient.invalidateQueries({ queryKey: ["info"] });
+            queryClient.invalidateQueries({ queryKey: ["info"], exact: true });
             if (ok) {
               toast.success("Downloader installed successfully");
             } else {
@@ -1,13 +1,16 @@
+import { memo } from "react";
+
 interface InfoRowProps {
   label: string;
   value: string;
 }
 
-export function InfoRow({ label, value }: InfoRowProps) {
+// Memoized: parents re-render on every query refresh, but label/value rarely change.
+export const InfoRow = memo(function InfoRow({ label, value }: InfoRowProps) {
   return (
     <div className="flex items-center justify-between py-1">
       <span className="text-sm text-muted-foreground">{label}</span>
       <span className="text-sm font-medium">{value}</span>
     </div>
   );
-}
+});
@@ -0,0 +1,67 @@
+import { toast } from "sonner";
+import { Button } from "@/components/ui/button";
+
+interface InstallStuckNoticeProps {
+  /** Short name of the operation, used in the copied debug header (e.g. "Install"). */
+  operation: string;
+  statusLog: string[];
+}
+
+/** Troubleshooting panel shown when a server install stops reporting progress. */
+export function InstallStuckNotice({ operation, statusLog }: InstallStuckNoticeProps) {
+  return (
+    <div className="space-y-2 rounded-md border border-amber-500/50 bg-amber-500/10 p-3">
+      <p className="text-sm text-amber-600 dark:text-amber-400">
+        Taking longer than expected. Possible causes:
+      </p>
+      <ul className="text-xs text-muted-foreground list-disc list-inside space-y-0.5">
+        <li>Network or firewall blocking the download</li>
+        <li>Auth expired – try Refresh Auth in Settings</li>
+      </ul>
+      <div className="pt-1 flex flex-wrap gap-2">
+        <Button
+          variant="ghost"
+          size="sm"
+          className="h-7 text-xs"
+          onClick={async () => {
+            try {
+              const { api } = await import("@/api/client");
+              const res = await api<{ logs: string }>("/api/debug/recent-logs");
+              const header = `--- ${operation} stuck, no output ---\nFrontend log: ${statusLog.join(" | ") || "(none)"}\n\nBackend logs:\n`;
+              await navigator.clipboard.writeText(header + (res?.logs ?? "(failed to fetch)"));
+              toast.success("Debug info copied");
+            } catch {
+              const header = `--- ${operation} stuck ---\nFrontend: ${statusLog.join(" | ") || "no output"}\n`;
+              await navigator.clipboard.writeText(header);
+              toast.success("Debug info copied");
+            }
+          }}
+        >
+          Copy debug info
+        </Button>
+        {statusLog.length > 0 && (
+          <Button
+            variant="ghost"
+            size="sm"
+            className="h-7 text-xs"
+            onClick={() => {
+              navigator.clipboard.writeText(statusLog.join("\n"));
+              toast.success("Log copied");
+            }}
+          >
+            Copy frontend log
+          </Button>
+        )}
+      </div>
+      {statusLog.length > 0 ? (
+        <pre className="text-xs text-muted-foreground font-mono bg-background/50 rounded p-2 max-h-24 overflow-y-auto whitespace-pre-wrap break-words">
+          {statusLog.join("\n")}
+        </pre>
+      ) : (
+        <p className="text-xs text-muted-foreground pt-1">
+          No output received. Copy debug info and share when reporting the issue.
+        </p>
+      )}
+    </div>
+  );
+}
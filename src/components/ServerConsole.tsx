@@ -1,4 +1,4 @@
-import { useState, useRef, useEffect, useLayoutEffect, useCallback } from "react";
+import { memo, useState, useRef, useEffect, useLayoutEffect, useCallback } from "react";
 import { List, ChevronDown, ChevronRight, Star, Plus } from "lucide-react";
 import { cn } from "@/lib/utils";
 import { api } from "@/api/client";
@@ -127,8 +127,20 @@ function parseLine(line: string): React.ReactNode[] {
   return out.length ? out : [line];
 }
 
+// A row keeps its parsed spans until its text changes, so typing a command or
+// opening the command list doesn't re-run the ANSI/link parser on every line.
+const ConsoleLine = memo(function ConsoleLine({ line }: { line: string }) {
+  return (
+    <div className="text-zinc-300 leading-relaxed whitespace-pre-wrap break-words">
+      {parseLine(line)}
+    </div>
+  );
+});
+
 interface ServerConsoleProps {
   lines: string[];
+  /** Stable id of lines[0]; row keys are firstLineId + index so trimming old lines doesn't re-render the rest. */
+  firstLineId?: number;
   running: boolean;
   className?: string;
   /** Add New under CUSTOM COMMANDS: navigate to Experimental → Custom console commands section. */
@@ -137,6 +149,7 @@ interface ServerConsoleProps {
 
 export function ServerConsole({
   lines,
+  firstLineId = 0,
   running,
   className,
   onAddCustomCommands,
@@ -175,6 +188,9 @@ export function ServerConsole({
     return scrollHeight - scrollTop - clientHeight < SCROLL_AT_BOTTOM_THRESHOLD;
   }, []);
 
+  // Id past the last line: keeps growing once the buffer is capped and its length stops changing.
+  const endLineId = firstLineId + lines.length;
+
   // useLayoutEffect + direct scrollTop so we keep up with rapid log output during startup
   useLayoutEffect(() => {
     if (lines.length === 0) return;
@@ -188,7 +204,7 @@ export function ServerConsole({
       }, 100);
       return () => clearTimeout(id);
     }
-  }, [lines.length, checkAtBottom]);
+  }, [endLineId, lines.length, checkAtBottom]);
 
   const handleScroll = useCallback(() => {
     if (programmaticScrollRef.current) return;
@@ -306,14 +322,7 @@ export function ServerConsole({
           {lines.length === 0 ? (
             <span className="text-muted-foreground">No output yet...</span>
           ) : (
-            lines.map((line, i) => (
-              <div
-                key={i}
-                className="text-zinc-300 leading-relaxed whitespace-pre-wrap break-words"
-              >
-                {parseLine(line)}
-              </div>
-            ))
+            lines.map((line, i) => <ConsoleLine key={firstLineId + i} line={line} />)
           )}
           <div ref={bottomRef} />
         </div>
@@ -4,3 +4,11 @@ import { twMerge } from "tailwind-merge";
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
 }
+
+const PERCENT_LABELS = Array.from({ length: 101 }, (_, i) => `${i}%`);
+
+/** "0%"–"100%" label for a progress value; clamped, and reuses one string per step. */
+export function formatPercent(value: number): string {
+  const i = Math.round(value);
+  return PERCENT_LABELS[i > 100 ? 100 : i > 0 ? i : 0];
+}
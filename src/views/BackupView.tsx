@@ -31,6 +31,22 @@ interface BackupViewProps {
   onNavigate?: (view: ViewName) => void;
 }
 
+// toLocaleString(locale, options) builds a new Intl formatter on every call;
+// one shared instance serves every backup row.
+const DATE_FORMAT = new Intl.DateTimeFormat(undefined, {
+  dateStyle: "medium",
+  timeStyle: "short",
+});
+
+function formatDate(iso: string | null) {
+  if (!iso) return "Unknown";
+  try {
+    return DATE_FORMAT.format(new Date(iso));
+  } catch {
+    return iso;
+  }
+}
+
 function isHytaleBackupEnabled(settings: { instance_server_settings?: Record<string, { startup_args?: string[] }> } | undefined, activeInstance: string): boolean {
   const all = settings?.instance_server_settings ?? {};
   const hasExplicitSettings = Boolean(activeInstance && activeInstance in all);
@@ -81,18 +97,6 @@ export function BackupView({ onNavigate }: BackupViewProps) {
     setConfirmDialog(null);
   };
 
-  const formatDate = (iso: string | null) => {
-    if (!iso) return "Unknown";
-    try {
-      return new Date(iso).toLocaleString(undefined, {
-        dateStyle: "medium",
-        timeStyle: "short",
-      });
-    } catch {
-      return iso;
-    }
-  };
-
   const handleOpenWorldSnapshotsFolder = async () => {
     try {
       const { path } = await api<{ path: string }>("/api/backups/world-snapshots-folder");
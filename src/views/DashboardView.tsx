@@ -119,7 +119,10 @@ function SortableInstanceCard({
 
   const isActive = inst.name === activeInstance;
   const thisInstalled = inst.installed;
-  const thisRunning = runningInstances.some((r) => r.name === inst.name);
+  // Resolved once per render; the stats row, crash notice and Copy IP all reuse them.
+  const runInfo = runningInstances.find((r) => r.name === inst.name);
+  const thisRunning = runInfo !== undefined;
+  const exitInfo = serverStatus?.last_exits?.[inst.name];
   const statusVariant = !thisInstalled
     ? "warning"
     : thisRunning
@@ -221,21 +224,17 @@ function SortableInstanceCard({
 
         {thisInstalled && (
           <div className="flex min-h-5 flex-wrap items-center gap-x-4 gap-y-1 text-xs text-muted-foreground">
-            {(() => {
-              const exitInfo = serverStatus?.last_exits?.[inst.name];
-              return exitInfo && exitInfo.exit_code !== 0 && !thisRunning;
-            })() ? (
+            {exitInfo && exitInfo.exit_code !== 0 && !thisRunning ? (
               <Tooltip>
                 <TooltipTrigger asChild>
                   <span className="text-amber-400 cursor-default">
-                    Crashed {serverStatus?.last_exits?.[inst.name]?.exit_time ? timeAgo(serverStatus.last_exits[inst.name].exit_time) : "recently"}
+                    Crashed {exitInfo.exit_time ? timeAgo(exitInfo.exit_time) : "recently"}
                   </span>
                 </TooltipTrigger>
-                <TooltipContent>Exit code {serverStatus?.last_exits?.[inst.name]?.exit_code}</TooltipContent>
+                <TooltipContent>Exit code {exitInfo.exit_code}</TooltipContent>
               </Tooltip>
             ) : (
               (() => {
-                const runInfo = runningInstances.find((r) => r.name === inst.name);
                 // Only show stats for this instance when it's running—never use another instance's stats
                 const uptime = thisRunning ? (runInfo?.uptime_seconds ?? null) : null;
                 const ram = thisRunning ? (runInfo?.ram_mb ?? null) : null;
@@ -379,7 +378,7 @@ function SortableInstanceCard({
                         size="icon"
                         variant="ghost"
                         className="h-8 w-8"
-                        onClick={() => onCopyIp(runningInstances.find((r) => r.name === inst.name)?.game_port ?? inst.game_port ?? 5520)}
+                        onClick={() => onCopyIp(runInfo?.game_port ?? inst.game_port ?? 5520)}
                       >
                         <Copy className="h-3.5 w-3.5" />
                       </Button>
@@ -19,6 +19,28 @@ import { useAllNitradoUpdateStatus } from "@/api/hooks/useMods";
 
 const AUTH_NEEDED = /no server tokens configured/i;
 const AUTH_ALREADY_LOADED = /token refresh scheduled|session service client initialized/i;
+/** Console lines kept in view; older lines are dropped so long runs stay responsive. */
+const MAX_CONSOLE_LINES = 10_000;
+
+/** Console lines plus the id of lines[0]; ids only grow, so rows keep their React key when old lines are dropped. */
+interface ConsoleBuffer {
+  lines: string[];
+  firstId: number;
+}
+
+const EMPTY_CONSOLE: ConsoleBuffer = { lines: [], firstId: 0 };
+
+function appendLines(prev: ConsoleBuffer, added: string[]): ConsoleBuffer {
+  const next = prev.lines.concat(added);
+  const drop = next.length - MAX_CONSOLE_LINES;
+  return drop > 0
+    ? { lines: next.slice(drop), firstId: prev.firstId + drop }
+    : { lines: next, firstId: prev.firstId };
+}
+
+function clearLines(prev: ConsoleBuffer): ConsoleBuffer {
+  return prev.lines.length ? { lines: [], firstId: prev.firstId + prev.lines.length } : prev;
+}
 
 export interface ServerViewProps {
   onNavigate?: (view: ViewName) => void;
@@ -42,12 +64,15 @@ export function ServerView({
   const isActiveInstanceRunning =
     !!activeInstance && runningInstances.some((r) => r.name === activeInstance);
 
-  const [lines, setLines] = useState<string[]>([]);
+  const [consoleBuffer, setConsoleBuffer] = useState<ConsoleBuffer>(EMPTY_CONSOLE);
+  const { lines, firstId: firstLineId } = consoleBuffer;
   const [connected, setConnected] = useState(false);
   const [authModalOpen, setAuthModalOpen] = useState(false);
   const authShownRef = useRef(false);
   const authPendingRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const linesRef = useRef<string[]>([]);
+  const pendingLinesRef = useRef<string[]>([]);
+  const flushFrameRef = useRef<number | null>(null);
   const abortRef = useRef<(() => void) | null>(null);
   const exitedRef = useRef(false);
 
@@ -110,9 +135,35 @@ export function ServerView({
     }
   }, [running]);
 
+  // EventSource delivers every output line in its own task, so lines are
+  // collected and applied once per animation frame rather than per event.
+  const flushPendingLines = useCallback(() => {
+    const added = pendingLinesRef.current;
+    if (added.length === 0) return;
+    pendingLinesRef.current = [];
+    setConsoleBuffer((prev) => appendLines(prev, added));
+  }, []);
+
+  const scheduleFlush = useCallback(() => {
+    if (flushFrameRef.current != null) return;
+    flushFrameRef.current = requestAnimationFrame(() => {
+      flushFrameRef.current = null;
+      flushPendingLines();
+    });
+  }, [flushPendingLines]);
+
+  useEffect(() => {
+    const onVisibilityChange = () => {
+      if (!document.hidden) flushPendingLines();
+    };
+    document.addEventListener("visibilitychange", onVisibilityChange);
+    return () => document.removeEventListener("visibilitychange", onVisibilityChange);
+  }, [flushPendingLines]);
+
   // Connect to the console SSE stream when server is running
   const connectConsole = useCallback((instance: string) => {
     if (abortRef.current) abortRef.current();
+    pendingLinesRef.current = [];
 
     setConnected(true);
     const consoleUrl = `/api/server/console?instance=${encodeURIComponent(instance)}`;
@@ -120,14 +171,23 @@ export function ServerView({
       onEvent(event, data) {
         const d = data as Record<string, unknown>;
         if (event === "output") {
-          setLines((prev) => [...prev, d.line as string]);
+          const pending = pendingLinesRef.current.push(d.line as string);
+          if (document.hidden) {
+            // Nothing is painted while the window is hidden: hold the lines and
+            // apply them in one update when it becomes visible again.
+            if (pending > 2 * MAX_CONSOLE_LINES) {
+              pendingLinesRef.current = pendingLinesRef.current.slice(-MAX_CONSOLE_LINES);
+            }
+          } else {
+            scheduleFlush();
+          }
         } else if (event === "done") {
           if (exitedRef.current) return;
           exitedRef.current = true;
-          setLines((prev) => [
-            ...prev,
-            `\n[Manager] Server exited (code ${d.code}).`,
-          ]);
+          flushPendingLines();
+          setConsoleBuffer((prev) =>
+            appendLines(prev, [`\n[Manager] Server exited (code ${d.code}).`])
+          );
           setConnected(false);
         }
       },
@@ -138,7 +198,7 @@ export function ServerView({
         setConnected(false);
       },
     });
-  }, []);
+  }, [flushPendingLines, scheduleFlush]);
 
   const doConnect = useCallback(() => {
     if (activeInstance) connectConsole(activeInstance);
@@ -147,7 +207,8 @@ export function ServerView({
   // When switching instances: disconnect and clear console
   useEffect(() => {
     if (abortRef.current) abortRef.current();
-    setLines([]);
+    pendingLinesRef.current = [];
+    setConsoleBuffer(clearLines);
     setConnected(false);
     exitedRef.current = false;
   }, [activeInstance]);
@@ -163,11 +224,12 @@ export function ServerView({
   useEffect(() => {
     return () => {
       if (abortRef.current) abortRef.current();
+      if (flushFrameRef.current != null) cancelAnimationFrame(flushFrameRef.current);
     };
   }, []);
 
   const handleStart = () => {
-    setLines([]);
+    setConsoleBuffer(clearLines);
     exitedRef.current = false;
     startServer.mutate(activeInstance || undefined, {
       onSuccess: () => {
@@ -179,7 +241,7 @@ export function ServerView({
   };
 
   const handleStop = () => {
-    setLines((prev) => [...prev, "[Manager] Stopping server..."]);
+    setConsoleBuffer((prev) => appendLines(prev, ["[Manager] Stopping server..."]));
     // Stop the instance we're viewing, or the running one if viewing a different instance
     const toStop = viewingRunningInstance ? activeInstance : runningInstance;
     stopServer.mutate(toStop ?? undefined);
@@ -276,7 +338,7 @@ export function ServerView({
         </Button>
         <Button
           variant="outline"
-          onClick={() => setLines([])}
+          onClick={() => setConsoleBuffer(clearLines)}
         >
           Clear Log
         </Button>
@@ -315,6 +377,7 @@ export function ServerView({
       {/* Console */}
       <ServerConsole
         lines={lines}
+        firstLineId={firstLineId}
         running={viewingRunningInstance && running}
         className="flex-1 min-h-0"
         onAddCustomCommands={onNavigateToCustomCommands}
@@ -200,7 +200,7 @@ export function SettingsView() {
             const ok = d.ok as boolean;
             const msg = d.message as string;
             setFetchingDownloader(false);
-            queryClient.invalidateQueries({ queryKey: ["info"] });
+            queryClient.invalidateQueries({ queryKey: ["info"], exact: true });
             if (ok) {
               toast.success("Downloader installed successfully");
             } else {
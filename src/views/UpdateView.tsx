@@ -14,11 +14,15 @@ import {
   DialogFooter,
 } from "@/components/ui/dialog";
 import { Label } from "@/components/ui/label";
-import { useUpdaterLocalStatus, useAllInstancesUpdateStatus } from "@/api/hooks/useUpdater";
+import {
+  useUpdaterLocalStatus,
+  useAllInstancesUpdateStatus,
+  useRefreshAllInstancesUpdateStatus,
+} from "@/api/hooks/useUpdater";
 import { useSettings, useUpdateSettings } from "@/api/hooks/useSettings";
 import { useInstances } from "@/api/hooks/useInstances";
 import { useServerStatus } from "@/api/hooks/useServer";
-import { useManagerUpdate, useAppInfo } from "@/api/hooks/useInfo";
+import { useManagerUpdate, useAppInfo, useRefreshManagerUpdate } from "@/api/hooks/useInfo";
 import { useAllNitradoUpdateStatus } from "@/api/hooks/useMods";
 import { useAggregatedPendingUpdates } from "@/api/hooks/useAggregatedUpdates";
 import { useQueryClient } from "@tanstack/react-query";
@@ -33,6 +37,7 @@ import {
   setPendingActionHighlight,
 } from "@/lib/pendingActionHighlight";
 import { toast } from "sonner";
+import { formatPercent } from "@/lib/utils";
 
 export interface UpdateViewProps {
   onNavigate?: (view: ViewName) => void;
@@ -60,9 +65,11 @@ export function UpdateView({ onNavigate }: UpdateViewProps = {}) {
   } = useUpdateFlow(refreshOnUpdateComplete);
   const [installOpen, setInstallOpen] = useState(false);
   const { data: localStatus } = useUpdaterLocalStatus();
-  const { data: allUpdateStatus, isLoading: checkingUpdates, refetch: refetchUpdates } = useAllInstancesUpdateStatus();
+  const { data: allUpdateStatus, isLoading: checkingUpdates } = useAllInstancesUpdateStatus();
+  const refreshUpdates = useRefreshAllInstancesUpdateStatus();
   const { data: managerUpdate } = useManagerUpdate();
   const { data: appInfo } = useAppInfo();
+  const refreshManagerUpdate = useRefreshManagerUpdate();
   const { refetch: refetchNitradoAll } = useAllNitradoUpdateStatus();
   const aggregated = useAggregatedPendingUpdates();
 
@@ -117,10 +124,13 @@ export function UpdateView({ onNavigate }: UpdateViewProps = {}) {
 
   const handleRefresh = () => {
     setUpdateDone(null);
-    void refetchUpdates();
+    void refreshUpdates();
     void refetchNitradoAll();
-    void queryClient.invalidateQueries({ queryKey: ["info"] });
-    void queryClient.invalidateQueries({ queryKey: ["info", "manager-update"] });
+    void queryClient.invalidateQueries({
+      queryKey: ["info"],
+      predicate: (query) => query.queryKey[1] !== "manager-update",
+    });
+    void refreshManagerUpdate();
     void queryClient.invalidateQueries({ queryKey: ["mods", "nitrado-update-status"] });
   };
 
@@ -813,12 +823,12 @@ export function UpdateView({ onNavigate }: UpdateViewProps = {}) {
             )}
             <div className="flex items-center gap-3">
               {backgroundUpdateInProgress && !updating ? (
-                <div className="flex flex-1 items-center gap-2">
+                <>
                   <Loader2 className="h-4 w-4 shrink-0 animate-spin text-muted-foreground" />
                   <div className="flex-1 h-3 rounded-full bg-primary/20 overflow-hidden">
                     <div className="h-full w-1/3 animate-pulse bg-primary/50 rounded-full" />
                   </div>
-                </div>
+                </>
               ) : (
                 <>
                   <Progress
@@ -832,7 +842,7 @@ export function UpdateView({ onNavigate }: UpdateViewProps = {}) {
                     }`}
                   />
                   <span className="text-sm font-medium w-12 text-right">
-                    {Math.round(progress)}%
+                    {formatPercent(progress)}
                   </span>
                 </>
               )}